@@ -4,23 +4,176 @@ Evaluates alignment between strategic goals and action plan tasks.
 """
 
 import json
+import re
 from typing import Any
 
-from .knowledge_graph import KnowledgeGraph
-from .llm_factory import DEFAULT_PROVIDER, LLM_PROVIDERS, create_llm
+from rdflib import Literal
+from rdflib.namespace import XSD
+
+from .knowledge_graph import KnowledgeGraph, local_name, prepare_query
+from .llm_cache import cache_key, load_cached_result, store_cached_result
+from .llm_factory import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PROVIDER,
+    LLM_PROVIDERS,
+    build_cached_messages,
+    create_llm,
+)
 from .llm_logger import log_llm_call
+from .llm_parsing import loads_lenient
+from .similarity import cosine_matrix
+
+# Static rubric sent ahead of every pair so providers can reuse the cached prefix
+ALIGNMENT_RUBRIC = """Judge how well an action plan task group (tg) advances a strategic objective (o) under its parent goal (g).
+Input is compact JSON. Keys: n=name, d=description, imp=strategic importance, why=reasoning, p=intended purpose, alloc=resource allocation, tasks=individual tasks, out=measurable outcome.
+relevance: none=no connection | indirect=tangentially related | partial=contributes but not primary focus | direct=directly advances the objective
+contribution_strength: tangential=peripheral support | supporting=important supporting role | primary=core driver of objective success
+reasoning: 1-2 sentences."""
+
+# Structured-output schema; the provider returns these fields directly
+# (OpenAI json_schema mode, Anthropic tool use) instead of free-form JSON text.
+ALIGNMENT_SCHEMA = {
+    "title": "alignment",
+    "description": "Alignment verdict for one objective and task group pair",
+    "type": "object",
+    "properties": {
+        "relevance": {"type": "string", "enum": ["none", "indirect", "partial", "direct"]},
+        "contribution_strength": {
+            "type": "string",
+            "enum": ["tangential", "supporting", "primary"],
+        },
+        "reasoning": {"type": "string"},
+    },
+    "required": ["relevance", "contribution_strength", "reasoning"],
+    "additionalProperties": False,
+}
+
+# Draft verdicts from the small model also report a confidence; drafts below
+# the threshold (or "partial", the most ambiguous class) are re-judged by the
+# default model.
+ALIGNMENT_DRAFT_SCHEMA = {
+    **ALIGNMENT_SCHEMA,
+    "title": "alignment_draft",
+    "properties": {
+        **ALIGNMENT_SCHEMA["properties"],
+        "confidence": {"type": "number", "description": "Confidence in this verdict, 0 to 1"},
+    },
+    "required": [*ALIGNMENT_SCHEMA["required"], "confidence"],
+}
+DRAFT_CONFIDENCE_THRESHOLD = 0.7
+
+# Objectives (with parent goal) and task groups (with child tasks) in a
+# single round trip; the UNION keeps the two branches from being
+# cross-joined into objectives x task groups x tasks rows. Parsed once at
+# import time.
+_PAIRS_QUERY = prepare_query(
+    """
+    PREFIX bita: <http://bita-system.org/ontology#>
+    PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+
+    SELECT ?objective ?goal ?tg ?task WHERE {
+        {
+            ?objective rdf:type bita:Objective .
+            ?goal bita:hasObjective ?objective .
+        }
+        UNION
+        {
+            ?tg rdf:type bita:TaskGroup .
+            OPTIONAL {
+                ?tg bita:hasTask ?task .
+                ?task rdf:type bita:Task .
+            }
+        }
+    }
+    """
+)
+
+# Abbreviated prompt key -> KG property name, per entity kind
+_GOAL_KEYS = (
+    ("n", "label"),
+    ("d", "description"),
+    ("imp", "strategicImportance"),
+    ("why", "importanceReasoning"),
+)
+_OBJECTIVE_KEYS = (("n", "label"), ("d", "description"))
+_TASK_GROUP_KEYS = (
+    ("n", "label"),
+    ("p", "intendedPurpose"),
+    ("alloc", "resourceAllocation"),
+    ("why", "allocationReasoning"),
+)
+_TASK_KEYS = (("n", "label"), ("d", "description"), ("out", "measurableOutcome"))
+
+# Reused for every prompt instead of configuring a new encoder per json.dumps
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Placeholder values the extractor may store for missing fields
+_EMPTY_VALUES = frozenset({"N/A", "n/a", "None", "null"})
+
+
+def _compact(props: dict, keys: tuple[tuple[str, str], ...]) -> dict:
+    """Project entity properties onto abbreviated keys in canonical form.
+
+    Empty and placeholder values are dropped and string whitespace is
+    collapsed, so cosmetic differences in the KG do not change the prompt
+    (and therefore the result-cache key).
+    """
+    compacted = {}
+    for short, name in keys:
+        value = props.get(name)
+        if isinstance(value, str):
+            value = _WHITESPACE.sub(" ", value).strip()
+            if value in _EMPTY_VALUES:
+                continue
+        if value:
+            compacted[short] = value
+    return compacted
+
+
+def _encode_fragment(
+    fragments: dict, value: dict | list[dict], keys: tuple[tuple[str, str], ...]
+) -> str:
+    """Encode one entity (or task list) as compact JSON, memoized by identity.
+
+    Pairs from get_strategy_action_pairs share the same property dicts, so
+    each goal, objective, task group and task list is encoded once per batch.
+    """
+    fragment = fragments.get(id(value))
+    if fragment is None:
+        if isinstance(value, list):
+            fragment = _COMPACT_ENCODER.encode([_compact(item, keys) for item in value])
+        else:
+            fragment = _COMPACT_ENCODER.encode(_compact(value, keys))
+        fragments[id(value)] = fragment
+    return fragment
 
 
 class AlignmentScorer:
     """Evaluates strategic-action alignment using LLM as judge."""
 
-    def __init__(self, api_key: str, model: str | None = None, provider: str = DEFAULT_PROVIDER):
+    def __init__(
+        self,
+        api_key: str,
+        model: str | None = None,
+        provider: str = DEFAULT_PROVIDER,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        prefilter_threshold: float | None = None,
+        use_draft_model: bool = False,
+    ):
         """Initialize alignment scorer.
 
         Args:
             api_key: API key for the LLM provider
             model: Model to use (defaults to provider's default)
             provider: LLM provider name
+            max_concurrency: Maximum number of alignment LLM calls in flight
+            prefilter_threshold: If set, pairs whose lexical similarity falls
+                below this value are scored "none" without calling the LLM
+            use_draft_model: Judge pairs with the provider's small model first
+                and only escalate low-confidence drafts to the main model
         """
         if model is None:
             model = LLM_PROVIDERS[provider]["default_model"]
@@ -30,6 +183,25 @@ class AlignmentScorer:
             api_key=api_key,
             temperature=0.0,  # Deterministic for scoring
         )
+        self.structured_llm = self.llm.with_structured_output(ALIGNMENT_SCHEMA, include_raw=True)
+        self.provider = provider
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.prefilter_threshold = prefilter_threshold
+
+        self.draft_model = None
+        self.structured_draft_llm = None
+        if use_draft_model:
+            self.draft_model = LLM_PROVIDERS[provider]["small_model"]
+            draft_llm = create_llm(
+                provider=provider,
+                model=self.draft_model,
+                api_key=api_key,
+                temperature=0.0,
+            )
+            self.structured_draft_llm = draft_llm.with_structured_output(
+                ALIGNMENT_DRAFT_SCHEMA, include_raw=True
+            )
 
     def get_strategy_action_pairs(
         self, kg: KnowledgeGraph
@@ -43,69 +215,249 @@ class AlignmentScorer:
             List of tuples: (objective_id, objective_props, task_group_id,
                              task_group_props, parent_goal_props, child_tasks)
         """
-        # Query all objectives with their parent goal
-        objective_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        results = kg.query_sparql(_PAIRS_QUERY)
+
+        # Group rows into objective -> goal and task group -> child task IDs
+        objective_goals: list[tuple[str, str]] = []
+        tg_task_ids: dict[str, list[str]] = {}
+        for row in results:
+            if "objective" in row:
+                objective_goals.append((local_name(row["objective"]), local_name(row["goal"])))
+                continue
+            task_ids = tg_task_ids.setdefault(local_name(row["tg"]), [])
+            if "task" in row:
+                task_ids.append(local_name(row["task"]))
+
+        # Fetch each entity's properties once, rather than once per pair
+        tg_ids = list(tg_task_ids)
+        tg_tasks = {
+            tg_id: [kg.get_entity_properties(task_id) for task_id in task_ids]
+            for tg_id, task_ids in tg_task_ids.items()
+        }
 
-        SELECT ?objective ?goal WHERE {
-            ?objective rdf:type bita:Objective .
-            ?goal bita:hasObjective ?objective .
+        obj_props_by_id = {
+            obj_id: kg.get_entity_properties(obj_id) for obj_id, _ in objective_goals
         }
-        """
-        objective_results = kg.query_sparql(objective_query)
+        goal_props_by_id = {
+            goal_id: kg.get_entity_properties(goal_id) for _, goal_id in objective_goals
+        }
+        tg_props_by_id = {tg_id: kg.get_entity_properties(tg_id) for tg_id in tg_ids}
 
-        # Query all task groups with their child tasks
-        task_group_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        pairs = []
+        for obj_id, goal_id in objective_goals:
+            obj_props = obj_props_by_id[obj_id]
+            goal_props = goal_props_by_id[goal_id]
+
+            for tg_id in tg_ids:
+                pairs.append(
+                    (
+                        obj_id,
+                        obj_props,
+                        tg_id,
+                        tg_props_by_id[tg_id],
+                        goal_props,
+                        tg_tasks[tg_id],
+                    )
+                )
 
-        SELECT ?tg WHERE {
-            ?tg rdf:type bita:TaskGroup .
-        }
+        return pairs
+
+    def _build_alignment_prompt(
+        self,
+        objective_props: dict,
+        task_group_props: dict,
+        parent_goal_props: dict | None = None,
+        child_tasks: list[dict] | None = None,
+        fragments: dict | None = None,
+    ) -> str:
+        """Build the per-pair part of the LLM-as-judge prompt (see ALIGNMENT_RUBRIC).
+
+        Properties are sent as minified JSON with the abbreviated keys
+        defined once in the rubric; missing fields are omitted rather than
+        spelled out as "N/A".
+
+        Args:
+            fragments: Optional memo of encoded fragments and prompt
+                heads/tails shared across a batch of pairs
         """
-        tg_results = kg.query_sparql(task_group_query)
+        if fragments is None:
+            fragments = {}
+
+        # The prompt is a goal+objective head and a task group+tasks tail.
+        # Both are memoized, so a batch of N objectives x M task groups
+        # builds N heads and M tails, and each pair is one concatenation.
+        # Goal and objective come first so consecutive pairs for the same
+        # objective share as long a prefix as possible.
+        head_key = ("head", id(parent_goal_props), id(objective_props))
+        head = fragments.get(head_key)
+        if head is None:
+            head = "{"
+            if parent_goal_props:
+                head += '"g":' + _encode_fragment(fragments, parent_goal_props, _GOAL_KEYS) + ","
+            head += '"o":' + _encode_fragment(fragments, objective_props, _OBJECTIVE_KEYS) + ","
+            fragments[head_key] = head
+
+        tail_key = ("tail", id(task_group_props), id(child_tasks))
+        tail = fragments.get(tail_key)
+        if tail is None:
+            tail = '"tg":' + _encode_fragment(fragments, task_group_props, _TASK_GROUP_KEYS)
+            if child_tasks:
+                tail += ',"tasks":' + _encode_fragment(fragments, child_tasks, _TASK_KEYS)
+            tail += "}"
+            fragments[tail_key] = tail
+
+        return head + tail
+
+    def _alignment_cache_key(self, prompt: str) -> str:
+        """Result-cache key for a pair prompt; changes with models or rubric."""
+        return cache_key(self.provider, self.model, self.draft_model, ALIGNMENT_RUBRIC, prompt)
+
+    def _load_cached_alignment(self, prompt: str) -> dict[str, Any] | None:
+        """Return a previously validated verdict for this prompt, if any."""
+        result = load_cached_result("alignment", self._alignment_cache_key(prompt))
+        if result is not None:
+            log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response=json.dumps(result), layer=2, model=self.model, cached=True)
+        return result
+
+    def _parse_alignment_response(
+        self, prompt: str, response: dict, model: str
+    ) -> dict[str, Any] | None:
+        """Validate the structured alignment verdict returned by the LLM.
 
-        # Pre-fetch child tasks for each task group
-        task_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+        Args:
+            prompt: Prompt that produced the response (for logging)
+            response: Output of the structured LLM with include_raw=True
+            model: Model that produced the response (for logging)
 
-        SELECT ?tg ?task WHERE {
-            ?tg bita:hasTask ?task .
-            ?task rdf:type bita:Task .
-        }
+        Returns:
+            Validated alignment dictionary (see evaluate_alignment), or None
+            if no verdict could be recovered
         """
-        task_results = kg.query_sparql(task_query)
+        result = response["parsed"]
+        raw = response["raw"]
+        raw_text = raw.content if isinstance(raw.content, str) else json.dumps(raw.content)
+
+        if result is None and raw_text:
+            # Salvage truncated or malformed JSON text before giving up
+            try:
+                repaired = loads_lenient(raw_text)
+                if isinstance(repaired, dict):
+                    result = repaired
+            except json.JSONDecodeError:
+                pass
+
+        if result is None:
+            error = str(response.get("parsing_error") or "No structured output returned")
+            log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response=raw_text, error=error, layer=2, model=model)
+            print(f"Failed to parse LLM alignment output: {error}")
+            return None
+
+        log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response=json.dumps(result), layer=2, model=model)
+
+        # Validate required fields
+        if "relevance" not in result:
+            result["relevance"] = "none"
+        if "contribution_strength" not in result:
+            result["contribution_strength"] = "tangential"
+        if "reasoning" not in result:
+            result["reasoning"] = "No reasoning provided"
+
+        # Validate enum values (tool-use schemas are not strictly enforced
+        # by every provider)
+        valid_relevance = ["none", "indirect", "partial", "direct"]
+        valid_strength = ["tangential", "supporting", "primary"]
+
+        if result["relevance"] not in valid_relevance:
+            print(f"Invalid relevance: {result['relevance']}, defaulting to 'none'")
+            result["relevance"] = "none"
+
+        if result["contribution_strength"] not in valid_strength:
+            print(
+                f"Invalid contribution_strength: {result['contribution_strength']}, defaulting to 'tangential'"
+            )
+            result["contribution_strength"] = "tangential"
 
-        # Build task group -> child tasks mapping
-        tg_tasks: dict[str, list[dict]] = {}
-        for row in task_results:
-            tg_id = str(row["tg"]).split("#")[-1]
-            task_id = str(row["task"]).split("#")[-1]
-            task_props = kg.get_entity_properties(task_id)
-            tg_tasks.setdefault(tg_id, []).append(task_props)
+        return result
 
-        pairs = []
-        for obj_row in objective_results:
-            obj_uri = str(obj_row["objective"])
-            obj_id = obj_uri.split("#")[-1]
-            obj_props = kg.get_entity_properties(obj_id)
+    def _judge_prompts(
+        self, structured_llm, model: str, prompts: list[str]
+    ) -> list[dict[str, Any] | None]:
+        """Run one batched structured LLM call and parse every response.
 
-            # Get parent goal context
-            goal_uri = str(obj_row["goal"])
-            goal_id = goal_uri.split("#")[-1]
-            goal_props = kg.get_entity_properties(goal_id)
+        Returns:
+            One validated verdict (or None on failure) per prompt
+        """
+        responses = structured_llm.batch(
+            [build_cached_messages(self.provider, ALIGNMENT_RUBRIC, p) for p in prompts],
+            config={"max_concurrency": self.max_concurrency},
+            return_exceptions=True,
+        )
 
-            for tg_row in tg_results:
-                tg_uri = str(tg_row["tg"])
-                tg_id = tg_uri.split("#")[-1]
-                tg_props = kg.get_entity_properties(tg_id)
-                child_tasks = tg_tasks.get(tg_id, [])
+        verdicts = []
+        for prompt, response in zip(prompts, responses):
+            if isinstance(response, Exception):
+                # One failed request should not discard the rest of the batch
+                log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response="", error=str(response), layer=2, model=model)
+                print(f"LLM alignment call failed: {response}")
+                verdicts.append(None)
+                continue
+            verdicts.append(self._parse_alignment_response(prompt, response, model))
+        return verdicts
 
-                pairs.append((obj_id, obj_props, tg_id, tg_props, goal_props, child_tasks))
+    def _evaluate_prompts(self, prompts: list[str]) -> list[dict[str, Any]]:
+        """Evaluate pair prompts via the result cache, draft model and main model.
 
-        return pairs
+        Args:
+            prompts: Per-pair prompts from _build_alignment_prompt
+
+        Returns:
+            Alignment dictionaries in the same order as prompts
+        """
+        # Only pairs without a memoized verdict go to the provider
+        results = [self._load_cached_alignment(prompt) for prompt in prompts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        total = len(prompts)
+        if len(pending) < total:
+            print(f"[{total - len(pending)}/{total}] alignment pairs loaded from cache")
+
+        if pending and self.structured_draft_llm is not None:
+            drafts = self._judge_prompts(
+                self.structured_draft_llm, self.draft_model, [prompts[i] for i in pending]
+            )
+            escalate = []
+            for i, draft in zip(pending, drafts):
+                confidence = draft.pop("confidence", None) if draft else None
+                if (
+                    isinstance(confidence, (int, float))
+                    and confidence >= DRAFT_CONFIDENCE_THRESHOLD
+                    and draft["relevance"] != "partial"
+                ):
+                    results[i] = draft
+                    store_cached_result("alignment", self._alignment_cache_key(prompts[i]), draft)
+                else:
+                    escalate.append(i)
+            print(f"[{total - len(escalate)}/{total}] alignment pairs evaluated ({self.draft_model} drafts)")
+            if escalate:
+                print(f"Escalating {len(escalate)}/{len(pending)} draft verdicts to {self.model}")
+            pending = escalate
+
+        if pending:
+            verdicts = self._judge_prompts(
+                self.structured_llm, self.model, [prompts[i] for i in pending]
+            )
+            for i, verdict in zip(pending, verdicts):
+                if verdict is None:
+                    results[i] = {
+                        "relevance": "none",
+                        "contribution_strength": "tangential",
+                        "reasoning": "Failed to evaluate alignment",
+                    }
+                    continue
+                results[i] = verdict
+                store_cached_result("alignment", self._alignment_cache_key(prompts[i]), verdict)
+            print(f"[{total}/{total}] alignment pairs evaluated ({self.model})")
+
+        return results
 
     def evaluate_alignment(
         self,
@@ -128,115 +480,69 @@ class AlignmentScorer:
             - contribution_strength: One of: primary, supporting, tangential
             - reasoning: Explanation for the classification
         """
-        # Build parent goal context
-        goal_context = ""
-        if parent_goal_props:
-            goal_context = f"""
-Parent Strategic Goal:
-- Name: {parent_goal_props.get('label', 'N/A')}
-- Description: {parent_goal_props.get('description', 'N/A')}
-- Importance: {parent_goal_props.get('strategicImportance', 'N/A')}
-- Reasoning: {parent_goal_props.get('importanceReasoning', 'N/A')}
-"""
+        prompt = self._build_alignment_prompt(
+            objective_props, task_group_props, parent_goal_props, child_tasks
+        )
+        return self._evaluate_prompts([prompt])[0]
 
-        # Build child tasks context
-        tasks_context = ""
-        if child_tasks:
-            task_lines = []
-            for t in child_tasks:
-                line = f"  - {t.get('label', 'N/A')}: {t.get('description', 'N/A')}"
-                outcome = t.get('measurableOutcome', '')
-                if outcome:
-                    line += f" (Outcome: {outcome})"
-                task_lines.append(line)
-            tasks_context = f"""
-Individual Tasks:
-{chr(10).join(task_lines)}
-"""
+    def evaluate_alignments_batch(
+        self, pairs: list[tuple[str, dict, str, dict, dict, list[dict]]]
+    ) -> list[dict[str, Any]]:
+        """Evaluate many objective and task group pairs in batched LLM calls.
 
-        prompt = f"""You are evaluating the alignment between a strategic objective and an action plan task group.
-{goal_context}
-Strategic Objective (specific, measurable target):
-- Name: {objective_props.get('label', 'N/A')}
-- Description: {objective_props.get('description', 'N/A')}
-
-Task Group:
-- Name: {task_group_props.get('label', 'N/A')}
-- Intended Purpose: {task_group_props.get('intendedPurpose', 'N/A')}
-- Resource Allocation: {task_group_props.get('resourceAllocation', 'N/A')}
-- Allocation Reasoning: {task_group_props.get('allocationReasoning', 'N/A')}
-{tasks_context}
-Evaluate the alignment and provide:
-1. relevance: How relevant is this task group to achieving the strategic objective?
-   - "none": No connection
-   - "indirect": Tangentially related
-   - "partial": Contributes but not primary focus
-   - "direct": Directly advances the objective
-
-2. contribution_strength: What is the strength of this task group's contribution?
-   - "tangential": Peripheral support
-   - "supporting": Important supporting role
-   - "primary": Core driver of objective success
-
-3. reasoning: Brief (1-2 sentences) explanation for your classification
-
-Return ONLY valid JSON with these three fields, no other text.
-
-JSON OUTPUT:"""
-
-        response = self.llm.invoke(prompt)
-        content = response.content.strip()
-
-        log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response=content, layer=2)
-
-        # Parse JSON, handling code blocks
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json or (not line.strip().startswith("```")):
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
-        try:
-            result = json.loads(content)
-            # Validate required fields
-            if "relevance" not in result:
-                result["relevance"] = "none"
-            if "contribution_strength" not in result:
-                result["contribution_strength"] = "tangential"
-            if "reasoning" not in result:
-                result["reasoning"] = "No reasoning provided"
-
-            # Validate enum values
-            valid_relevance = ["none", "indirect", "partial", "direct"]
-            valid_strength = ["tangential", "supporting", "primary"]
-
-            if result["relevance"] not in valid_relevance:
-                print(f"Invalid relevance: {result['relevance']}, defaulting to 'none'")
-                result["relevance"] = "none"
-
-            if result["contribution_strength"] not in valid_strength:
-                print(
-                    f"Invalid contribution_strength: {result['contribution_strength']}, defaulting to 'tangential'"
+        Args:
+            pairs: Pair tuples as returned by get_strategy_action_pairs
+
+        Returns:
+            Alignment dictionaries in the same order as pairs
+        """
+        # Entities shared between pairs are encoded once for the whole batch
+        fragments: dict[Any, str] = {}
+        prompts = [
+            self._build_alignment_prompt(obj_props, tg_props, goal_props, child_tasks, fragments)
+            for _, obj_props, _, tg_props, goal_props, child_tasks in pairs
+        ]
+        return self._evaluate_prompts(prompts)
+
+    def prefilter_pairs(
+        self, pairs: list[tuple[str, dict, str, dict, dict, list[dict]]]
+    ) -> list[bool]:
+        """Flag pairs similar enough to be worth an LLM evaluation.
+
+        Uses TF-IDF cosine similarity between the objective text and the task
+        group text (purpose plus child tasks). Every pair passes when
+        prefilter_threshold is None.
+
+        Args:
+            pairs: Pair tuples as returned by get_strategy_action_pairs
+
+        Returns:
+            One flag per pair; False means the pair can be scored "none"
+        """
+        if self.prefilter_threshold is None:
+            return [True] * len(pairs)
+
+        obj_texts: dict[str, str] = {}
+        tg_texts: dict[str, str] = {}
+        for obj_id, obj_props, tg_id, tg_props, _, child_tasks in pairs:
+            if obj_id not in obj_texts:
+                obj_texts[obj_id] = f"{obj_props.get('label', '')} {obj_props.get('description', '')}"
+            if tg_id not in tg_texts:
+                task_text = " ".join(
+                    f"{t.get('label', '')} {t.get('description', '')}" for t in child_tasks
+                )
+                tg_texts[tg_id] = (
+                    f"{tg_props.get('label', '')} {tg_props.get('intendedPurpose', '')} {task_text}"
                 )
-                result["contribution_strength"] = "tangential"
 
-            return result
+        obj_index = {obj_id: i for i, obj_id in enumerate(obj_texts)}
+        tg_index = {tg_id: j for j, tg_id in enumerate(tg_texts)}
+        sim = cosine_matrix(list(obj_texts.values()), list(tg_texts.values()))
 
-        except json.JSONDecodeError as e:
-            log_llm_call(caller="AlignmentScorer.evaluate_alignment", prompt=prompt, response=content, error=str(e), layer=2)
-            print(f"Failed to parse LLM alignment output as JSON: {e}")
-            print(f"Output was: {content[:500]}")
-            return {
-                "relevance": "none",
-                "contribution_strength": "tangential",
-                "reasoning": "Failed to parse LLM output",
-            }
+        return [
+            sim[obj_index[obj_id], tg_index[tg_id]] >= self.prefilter_threshold
+            for obj_id, _, tg_id, _, _, _ in pairs
+        ]
 
     def score_all_alignments(self, kg: KnowledgeGraph):
         """Evaluate all objective to task group alignments.
@@ -254,20 +560,36 @@ JSON OUTPUT:"""
 
         print(f"\nEvaluating {total_pairs} objective-action alignment pairs...")
 
-        for idx, (obj_id, obj_props, tg_id, tg_props, goal_props, child_tasks) in enumerate(pairs, 1):
-            print(
-                f"[{idx}/{total_pairs}] Evaluating {obj_id} <-> {tg_id}...", end=" "
-            )
-
-            # Evaluate alignment with full context
-            alignment_result = self.evaluate_alignment(
-                obj_props, tg_props, goal_props, child_tasks
-            )
+        # Pairs that survive the pre-filter go through the provider in one
+        # batch; KG writes follow pair order on this thread since rdflib
+        # graphs are not thread-safe.
+        keep = self.prefilter_pairs(pairs)
+        kept_pairs = [pair for pair, flag in zip(pairs, keep) if flag]
+        if len(kept_pairs) < total_pairs:
+            print(f"Pre-filter skipped {total_pairs - len(kept_pairs)} low-similarity pairs")
+
+        kept_results = iter(self.evaluate_alignments_batch(kept_pairs))
+        results = [
+            next(kept_results)
+            if flag
+            else {
+                "relevance": "none",
+                "contribution_strength": "tangential",
+                "reasoning": "Skipped by lexical pre-filter",
+            }
+            for flag in keep
+        ]
 
+        # Alignment edges and property triples for all pairs, written at once
+        triples = []
+        aligned_count = 0
+        for (obj_id, _, tg_id, _, _, _), alignment_result in zip(pairs, results):
             # Only write edge if there's meaningful alignment
             if alignment_result["relevance"] != "none":
+                aligned_count += 1
+                tg_uri = kg.bita[tg_id]
                 # Create alignment edge with properties
-                kg.add_relationship(tg_id, "supportsObjective", obj_id)
+                triples.append((tg_uri, kg.bita.supportsObjective, kg.bita[obj_id]))
 
                 # Add alignment properties as separate triples
                 # (In a more sophisticated design, we'd use RDF reification or named graphs,
@@ -281,18 +603,14 @@ JSON OUTPUT:"""
                 }
 
                 # Update task group entity with alignment properties
-                tg_uri = kg.bita[tg_id]
-                for prop_name, prop_value in alignment_props.items():
-                    predicate = kg.bita[prop_name]
-                    from rdflib import Literal
-                    from rdflib.namespace import XSD
-
-                    kg.graph.add((tg_uri, predicate, Literal(prop_value, datatype=XSD.string)))
-
-                print(
-                    f"✓ {alignment_result['relevance']} ({alignment_result['contribution_strength']})"
+                triples.extend(
+                    (tg_uri, kg.bita[prop_name], Literal(prop_value, datatype=XSD.string))
+                    for prop_name, prop_value in alignment_props.items()
                 )
-            else:
-                print("✗ no alignment")
 
-        print("\nAlignment evaluation complete!")
+        kg.add_triples(triples)
+
+        print(
+            f"\nAlignment evaluation complete! {aligned_count} aligned, "
+            f"{total_pairs - aligned_count} with no alignment"
+        )
@@ -3,15 +3,21 @@
 Assesses strategy-to-action alignment, generates deep entity-specific recommendations.
 """
 
+import io
 import json
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable
 
-from .knowledge_graph import KnowledgeGraph
+from .completeness import HIGH_SEVERITY_IDX, CompletenessAnalyzer
+from .knowledge_graph import KnowledgeGraph, local_name, prepare_query
+from .llm_cache import cache_key, load_cached_result, store_cached_result
 from .llm_factory import DEFAULT_PROVIDER, LLM_PROVIDERS, create_llm
 from .llm_logger import log_llm_call
+from .llm_parsing import loads, strip_code_fences
 
 
-VALID_VERDICTS = {"strong", "adequate", "weak", "critical"}
+VALID_VERDICTS = frozenset({"strong", "adequate", "weak", "critical"})
 
 ALIGNMENT_DIMENSIONS = {
     "strategic_coverage": "Strategic Coverage",
@@ -22,27 +28,404 @@ ALIGNMENT_DIMENSIONS = {
     "execution_readiness": "Execution Readiness",
 }
 
+# Constant context-building queries, parsed once at import time
+_PREFIXES = """
+PREFIX bita: <http://bita-system.org/ontology#>
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+"""
+_GOAL_OBJECTIVES_QUERY = prepare_query(
+    _PREFIXES
+    + "SELECT ?g ?o WHERE { ?g rdf:type bita:Goal . OPTIONAL { ?g bita:hasObjective ?o . } }"
+)
+_TASK_COUNTS_QUERY = prepare_query(
+    _PREFIXES + "SELECT ?tg (COUNT(?t) AS ?cnt) WHERE { ?tg bita:hasTask ?t . } GROUP BY ?tg"
+)
+
+
+# Layer 4 prompt templates, filled with str.format(context=...). Part of the
+# response-cache key, so editing a template invalidates its cached answers.
+_ASSESS_ALIGNMENT_PROMPT = """You are evaluating how well an organization's actions align with its strategy.
+
+Below is a data summary from alignment analysis layers:
+
+{context}
+
+Assess these 6 alignment dimensions. For each, provide:
+- a verdict (strong / adequate / weak / critical)
+- a brief reasoning sentence
+- 1-3 specific examples from the data above that support your verdict. Each example MUST use entity titles/names (e.g., "Revenue Growth", "Sales Initiative", "Customer Satisfaction KPI"). NEVER use internal codes like G1, TG2, G1_O1, A1_2 in the examples. Write examples in plain language that a business user can understand.
+
+Dimensions:
+1. strategic_coverage — Are all objectives backed by action plans? Consider orphan counts and coverage.
+2. alignment_quality — How strong are the strategy-action links? Consider alignment relevance/strength distribution.
+3. resource_adequacy — Does resource allocation match strategic priorities? Consider execution gaps.
+4. goal_cascade_coherence — Do task goals flow logically from strategy? Consider cascade strengths and sufficiency levels.
+5. bsc_balance — Is there balanced BSC perspective coverage with causal links? Consider BSC coverage and causal link data.
+6. execution_readiness — Are actions concrete and measurable? Consider KPI quality indicators.
+
+Return ONLY valid JSON:
+{{
+  "strategic_coverage": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
+  "alignment_quality": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
+  "resource_adequacy": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
+  "goal_cascade_coherence": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
+  "bsc_balance": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
+  "execution_readiness": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}}
+}}
+
+JSON OUTPUT:"""
+
+_RECOMMENDATIONS_PROMPT = """You are an expert in Business-IT Alignment and Balanced Scorecard strategy.
+
+Below is a detailed data summary of an organization's strategic plan analysis, including goals, objectives, task groups, KPIs, orphans, execution gaps, BSC coverage, and cascade data.
+
+{context}
+
+Based on this data, generate 4-8 specific, actionable recommendations. Each recommendation MUST reference actual entity names/titles from the data above (not generic advice).
+
+IMPORTANT: In all text fields (title, gap_description, business_impact, recommended_actions), always use entity titles/names (e.g., "Revenue Growth", "Sales Initiative"). NEVER use internal codes like G1, TG2, G1_O1, A1_2. Write in plain language that a business user can understand. The only place codes should appear is in the "affected_entities" array.
+
+Return ONLY a valid JSON array. Each element must have these fields:
+- "title": Short entity-specific title using names (e.g., "Allocate Resources for Digital Transformation Initiative")
+- "category": one of "orphan_objective" | "orphan_task" | "resource_gap" | "bsc_gap" | "alignment_weakness" | "kpi_quality"
+- "priority": one of "critical" | "high" | "medium" | "low"
+- "priority_reasoning": Why this priority level
+- "gap_description": What the gap is, referencing specific entity names (not codes)
+- "business_impact": Why this gap matters for the organization
+- "recommended_actions": Array of 2-3 specific actionable steps using entity names
+- "affected_entities": Array of entity IDs involved (e.g., ["G1", "TG2", "O1"])
+
+JSON OUTPUT:"""
+
+
+# Placeholder for a dimension the model omitted or returned malformed
+_UNASSESSED_DIMENSION = {"verdict": "weak", "reasoning": "Unable to assess (data unavailable).", "examples": []}
+
+
+def _normalize_dimension(entry: Any) -> dict[str, Any]:
+    """Coerce one dimension of an assess_alignment response into shape.
+
+    Lowercases the verdict (falling back to "weak" if unrecognized) and
+    keeps examples as a list of non-empty strings.
+    """
+    if not isinstance(entry, dict):
+        return {**_UNASSESSED_DIMENSION, "examples": []}
+    verdict = str(entry.get("verdict", "")).lower()
+    entry["verdict"] = verdict if verdict in VALID_VERDICTS else "weak"
+    examples = entry.get("examples")
+    entry["examples"] = [str(e) for e in examples if e] if isinstance(examples, list) else []
+    return entry
+
+
+# Field layout shared by all rule-based recommendations; constant fields
+# are filled per category and the rest per entity via _recommendation()
+_RECOMMENDATION_TEMPLATE: dict[str, Any] = {
+    "title": "",
+    "category": "alignment_weakness",
+    "priority": "medium",
+    "priority_reasoning": "",
+    "gap_description": "",
+    "business_impact": "",
+    "recommended_actions": [],
+    "affected_entities": [],
+}
+_ORPHAN_OBJECTIVE_TEMPLATE = {
+    **_RECOMMENDATION_TEMPLATE,
+    "category": "orphan_objective",
+    "priority": "high",
+    "priority_reasoning": "Objectives without supporting tasks cannot be executed.",
+}
+_ORPHAN_TASK_TEMPLATE = {
+    **_RECOMMENDATION_TEMPLATE,
+    "category": "orphan_task",
+    "priority": "medium",
+    "priority_reasoning": "Unaligned task groups consume resources without strategic justification.",
+}
+_BSC_GAP_TEMPLATE = {
+    **_RECOMMENDATION_TEMPLATE,
+    "category": "bsc_gap",
+    "priority": "high",
+    "priority_reasoning": "Unbalanced BSC coverage leads to strategic blind spots.",
+    "business_impact": "An unbalanced strategy risks neglecting critical areas, leading to unsustainable performance.",
+}
+_RESOURCE_GAP_TEMPLATE = {**_RECOMMENDATION_TEMPLATE, "category": "resource_gap"}
+
+
+def _recommendation(template: dict[str, Any], **fields: Any) -> dict[str, Any]:
+    """Copy a recommendation template and fill in the per-entity fields."""
+    rec = template.copy()
+    rec.update(fields)
+    return rec
+
+
+def _orphan_objective_recommendation(obj_id: str, props: dict[str, Any]) -> dict[str, Any]:
+    """Fallback recommendation for an objective with no supporting task groups."""
+    name = props.get("label", obj_id)
+    return _recommendation(
+        _ORPHAN_OBJECTIVE_TEMPLATE,
+        title=f"Create Action Plan for '{name}'",
+        gap_description=f"Objective '{name}' ({obj_id}) has no supporting task groups assigned to it.",
+        business_impact=f"Without action plans, the objective '{name}' remains aspirational and will not translate into operational outcomes.",
+        recommended_actions=[
+            f"Identify or create task groups that can support '{name}'.",
+            f"Assign appropriate resource allocation to new task groups.",
+            f"Define KPIs to track progress toward '{name}'.",
+        ],
+        affected_entities=[obj_id],
+    )
+
+
+def _orphan_task_recommendation(tg_id: str, props: dict[str, Any]) -> dict[str, Any]:
+    """Fallback recommendation for a task group aligned to no objective."""
+    name = props.get("label", tg_id)
+    purpose = props.get("intendedPurpose", "N/A")
+    return _recommendation(
+        _ORPHAN_TASK_TEMPLATE,
+        title=f"Align '{name}' to Strategic Objectives",
+        gap_description=f"Task group '{name}' ({tg_id}, purpose: {purpose}) has no alignment to any strategic objective.",
+        business_impact=f"Resources allocated to '{name}' may be wasted if not aligned to organizational strategy.",
+        recommended_actions=[
+            f"Review the intended purpose of '{name}' and map it to relevant objectives.",
+            f"If no strategic fit exists, consider reallocating its resources.",
+        ],
+        affected_entities=[tg_id],
+    )
+
+
+def _resource_gap_recommendation(gap: dict[str, Any], obj_name: str, tg_name: str) -> dict[str, Any]:
+    """Fallback recommendation for an under-resourced objective / task group pair."""
+    obj_id = gap["objective_id"]
+    tg_id = gap["task_group_id"]
+    allocation = gap["allocation"]
+    score = f"{gap['gap_score']:.0f}"
+    return _recommendation(
+        _RESOURCE_GAP_TEMPLATE,
+        title=f"Increase Resources for '{tg_name}' Supporting '{obj_name}'",
+        priority=gap["severity"],
+        priority_reasoning=f"Gap score of {score} indicates significant resource-importance mismatch.",
+        gap_description=(
+            f"'{tg_name}' ({tg_id}) supports '{obj_name}' ({obj_id}) but has "
+            f"allocation={allocation} vs importance={gap['importance']} (gap={score})."
+        ),
+        business_impact=f"Under-resourcing '{tg_name}' jeopardizes achievement of '{obj_name}'.",
+        recommended_actions=[
+            f"Increase resource allocation for '{tg_name}' from {allocation} to match strategic importance.",
+            f"Review and optimize task priorities within '{tg_name}'.",
+        ],
+        affected_entities=[obj_id, tg_id],
+    )
+
+
+class _PropsOrNA(dict):
+    """Entity properties where props[key] reads as "N/A" for a missing key.
+
+    Lets prompt f-strings index directly instead of repeating
+    .get(key, "N/A"); .get() and `in` behave as on a plain dict.
+    """
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
+def _memoized_props(kg: KnowledgeGraph) -> Callable[[str], dict[str, Any]]:
+    """Return a get_entity_properties lookup that fetches each entity once.
+
+    Context builders resolve the same objectives and task groups many times
+    (once per referencing task group, gap, cascade entry, ...). Results are
+    _PropsOrNA dicts.
+    """
+    cache: dict[str, _PropsOrNA] = {}
+
+    def get_props(entity_id: str) -> dict[str, Any]:
+        props = cache.get(entity_id)
+        if props is None:
+            props = cache[entity_id] = _PropsOrNA(kg.get_entity_properties(entity_id))
+        return props
+
+    return get_props
+
+
+def _memoized_labels(get_props: Callable[[str], dict[str, Any]]) -> Callable[[str], str]:
+    """Return an ID -> display label lookup (falling back to the ID itself).
+
+    Most context lines only need an entity's name, so labels get their own
+    flat cache on top of the property lookup.
+    """
+    labels: dict[str, str] = {}
+
+    def label_of(entity_id: str) -> str:
+        label = labels.get(entity_id)
+        if label is None:
+            label = labels[entity_id] = get_props(entity_id).get("label", entity_id)
+        return label
+
+    return label_of
+
+
+def _partition_props(
+    props: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Split per-objective assessment properties in a single pass.
+
+    Args:
+        props: Entity properties (typically a task group's)
+
+    Returns:
+        (relevance, cascade, sufficiency) dicts keyed by objective ID, from
+        alignment_<id>_relevance, cascade_<id>_strength and
+        sufficiency_<id>_level properties respectively
+    """
+    relevance, cascade, sufficiency = {}, {}, {}
+    for k, v in props.items():
+        if k.startswith("alignment_"):
+            if k.endswith("_relevance"):
+                relevance[k[len("alignment_"):-len("_relevance")]] = v
+        elif k.startswith("cascade_"):
+            if k.endswith("_strength"):
+                cascade[k[len("cascade_"):-len("_strength")]] = v
+        elif k.startswith("sufficiency_") and k.endswith("_level"):
+            sufficiency[k[len("sufficiency_"):-len("_level")]] = v
+    return relevance, cascade, sufficiency
+
 
 class BenchmarkingAgent:
     """Agent for alignment assessment and improvement recommendations."""
 
-    def __init__(self, api_key: str, model: str | None = None, provider: str = DEFAULT_PROVIDER):
+    def __init__(
+        self,
+        api_key: str,
+        model: str | None = None,
+        provider: str = DEFAULT_PROVIDER,
+        cache_responses: bool = False,
+    ):
         """Initialize benchmarking agent.
 
         Args:
             api_key: API key for the LLM provider
             model: Model to use (defaults to provider's default)
             provider: LLM provider name
+            cache_responses: Reuse validated answers from the on-disk result
+                cache. Off by default: these calls sample at temperature
+                0.3, and a cached answer replaces a fresh sample.
         """
         if model is None:
             model = LLM_PROVIDERS[provider]["default_model"]
+        self.provider = provider
+        self.model = model
+        self.temperature = 0.3  # Slightly creative for recommendations
+        self.cache_responses = cache_responses
         self.llm = create_llm(
             provider=provider,
             model=model,
             api_key=api_key,
-            temperature=0.3,  # Slightly creative for recommendations
+            temperature=self.temperature,
         )
         self.kg = None
+        # Built context strings keyed by (kind, KG fingerprint, results hash)
+        self._context_cache: dict[tuple, str] = {}
+        # (KG fingerprint, property lookup, label lookup) shared by both
+        # context builders and the fallback recommendations
+        self._lookups: tuple[tuple[int, int], Callable, Callable] | None = None
+
+    def _get_context(
+        self,
+        kind: str,
+        builder: Callable[[KnowledgeGraph, dict], str],
+        kg: KnowledgeGraph,
+        completeness_results: dict,
+    ) -> str:
+        """Return a context string, rebuilding only if the inputs changed.
+
+        Args:
+            kind: Context name used in the cache key
+            builder: Context-building method to call on a miss
+            kg: KnowledgeGraph instance
+            completeness_results: Results from Layer 3
+        """
+        key = (kind, kg.fingerprint(), cache_key(completeness_results))
+        context = self._context_cache.get(key)
+        if context is None:
+            context = self._context_cache[key] = builder(kg, completeness_results)
+        return context
+
+    def _entity_lookups(
+        self, kg: KnowledgeGraph
+    ) -> tuple[Callable[[str], dict[str, Any]], Callable[[str], str]]:
+        """Return memoized property and label lookups for the graph's current state.
+
+        Shared across the context builders and fallback recommendations, so
+        an entity referenced by several of them is fetched once; reset when
+        the KG fingerprint changes.
+        """
+        fingerprint = kg.fingerprint()
+        if self._lookups is None or self._lookups[0] != fingerprint:
+            get_props = _memoized_props(kg)
+            self._lookups = (fingerprint, get_props, _memoized_labels(get_props))
+        return self._lookups[1], self._lookups[2]
+
+    def _response_cache_key(
+        self, template: str, kg: KnowledgeGraph, completeness_results: dict
+    ) -> str:
+        """Result-cache key for a prompt's inputs, computable without building the context.
+
+        Changes with provider, model, temperature, prompt template, graph
+        content or Layer 3 results.
+        """
+        return cache_key(
+            self.provider, self.model, self.temperature, template,
+            kg.content_hash(), completeness_results,
+        )
+
+    def _invoke(
+        self,
+        caller: str,
+        namespace: str,
+        template: str,
+        builder: Callable[[KnowledgeGraph, dict], str],
+        kg: KnowledgeGraph,
+        completeness_results: dict,
+    ) -> tuple[str, str, str | None]:
+        """Return the model's (fence-stripped) answer, from the result cache if possible.
+
+        With cache_responses on, the cache is checked before the context
+        is built, so a hit skips both context construction and the LLM
+        round-trip.
+
+        Args:
+            caller: Name recorded in the LLM log
+            namespace: Result-cache namespace (also the context cache kind)
+            template: Prompt template with a {context} placeholder
+            builder: Context-building method
+            kg: KnowledgeGraph instance
+            completeness_results: Results from Layer 3
+
+        Returns:
+            Tuple of (response content, prompt sent (the bare template on a
+            cache hit), cache key to store the content under once validated,
+            or None if it came from the cache or caching is off)
+        """
+        key = None
+        if self.cache_responses:
+            key = self._response_cache_key(template, kg, completeness_results)
+            cached = load_cached_result(namespace, key)
+            if isinstance(cached, str):
+                log_llm_call(caller=caller, prompt=template, response=cached, layer=4, cached=True)
+                return cached, template, None
+
+        context = self._get_context(namespace, builder, kg, completeness_results)
+        prompt = template.format(context=context)
+        response = self.llm.invoke(prompt)
+        content = response.content.strip()
+
+        log_llm_call(
+            caller=caller,
+            prompt=prompt,
+            response=content,
+            layer=4,
+        )
+
+        # Strip markdown fences
+        return strip_code_fences(content), prompt, key
 
     def _build_alignment_context(
         self, kg: KnowledgeGraph, completeness_results: dict
@@ -54,71 +437,59 @@ class BenchmarkingAgent:
         cascade/sufficiency data, BSC balance, and KPI quality.
         Names are presented first for readability.
         """
+        get_props, label_of = self._entity_lookups(kg)
         sections = []
 
         # 1. Goals summary
-        goal_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?obj WHERE { ?obj rdf:type bita:Goal . }
-        """
-        goal_rows = kg.query_sparql(goal_query)
         goal_lines = []
-        for row in goal_rows:
-            obj_id = str(row["obj"]).split("#")[-1]
-            props = kg.get_entity_properties(obj_id)
-            support_count = sum(
-                1 for k in props if k.startswith("alignment_") and k.endswith("_relevance")
-            )
+        for obj_id in kg.subjects_of_type("Goal"):
+            props = get_props(obj_id)
+            support_count = len(_partition_props(props)[0])
             bsc = props.get("bscPerspective", "N/A")
             label = props.get("label", obj_id)
             goal_lines.append(
-                f"- {label} | importance={props.get('strategicImportance', 'N/A')} | bsc={bsc} | supporting_task_groups={support_count}"
+                f"- {label} | importance={props['strategicImportance']} | bsc={bsc} | supporting_task_groups={support_count}"
             )
         sections.append(f"GOALS ({len(goal_lines)}):\n" + "\n".join(goal_lines) if goal_lines else "GOALS: None found")
 
-        # 2. Task groups summary
-        tg_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?tg WHERE { ?tg rdf:type bita:TaskGroup . }
-        """
-        tg_rows = kg.query_sparql(tg_query)
+        # 2. Task groups summary, in a single pass that also tallies the
+        # alignment distribution (section 4) and cascade / sufficiency
+        # levels (section 6) from the same per-objective assessments
+        relevance_counts = {"direct": 0, "partial": 0, "indirect": 0, "none": 0}
+        cascade_strengths = {"strong": 0, "moderate": 0, "weak": 0}
+        sufficiency_levels = {"fully_sufficient": 0, "partially_sufficient": 0, "insufficient": 0}
         tg_lines = []
-        for row in tg_rows:
-            tg_id = str(row["tg"]).split("#")[-1]
-            props = kg.get_entity_properties(tg_id)
+        for tg_id in kg.subjects_of_type("TaskGroup"):
+            props = get_props(tg_id)
+            relevance, cascade, sufficiency = _partition_props(props)
+            for v in relevance.values():
+                relevance_counts[v] = relevance_counts.get(v, 0) + 1
+            for v in cascade.values():
+                cascade_strengths[v] = cascade_strengths.get(v, 0) + 1
+            for v in sufficiency.values():
+                sufficiency_levels[v] = sufficiency_levels.get(v, 0) + 1
+
             tg_label = props.get("label", tg_id)
             # Resolve supported objective names
-            supported_names = []
-            for k in props:
-                if k.startswith("alignment_") and k.endswith("_relevance"):
-                    o_id = k.replace("alignment_", "").replace("_relevance", "")
-                    o_props = kg.get_entity_properties(o_id)
-                    supported_names.append(o_props.get("label", o_id))
+            supported_names = [label_of(o_id) for o_id in relevance]
             tg_lines.append(
-                f"- {tg_label} | allocation={props.get('resourceAllocation', 'N/A')} | supports={', '.join(supported_names) if supported_names else 'none'}"
+                f"- {tg_label} | allocation={props['resourceAllocation']} | supports={', '.join(supported_names) if supported_names else 'none'}"
             )
         sections.append(f"TASK GROUPS ({len(tg_lines)}):\n" + "\n".join(tg_lines) if tg_lines else "TASK GROUPS: None found")
 
         # 3. Orphans (resolve names)
         orphan_objs = completeness_results.get("orphan_objectives", [])
         orphan_tasks = completeness_results.get("orphan_tasks", [])
-        orphan_obj_names = [kg.get_entity_properties(oid).get("label", oid) for oid in orphan_objs[:5]]
-        orphan_tg_names = [kg.get_entity_properties(tid).get("label", tid) for tid in orphan_tasks[:5]]
+        # Only the first five are shown; resolved through the shared lookup
+        # so IDs already fetched for sections 1-2 cost nothing
+        orphan_obj_names = [label_of(oid) for oid in islice(orphan_objs, 5)]
+        orphan_tg_names = [label_of(tid) for tid in islice(orphan_tasks, 5)]
         sections.append(
             f"ORPHANS: {len(orphan_objs)} orphan objectives ({', '.join(orphan_obj_names)}), "
             f"{len(orphan_tasks)} orphan tasks ({', '.join(orphan_tg_names)})"
         )
 
-        # 4. Alignment distribution
-        relevance_counts = {"direct": 0, "partial": 0, "indirect": 0, "none": 0}
-        for row in tg_rows:
-            tg_id = str(row["tg"]).split("#")[-1]
-            props = kg.get_entity_properties(tg_id)
-            for k, v in props.items():
-                if k.startswith("alignment_") and k.endswith("_relevance"):
-                    relevance_counts[v] = relevance_counts.get(v, 0) + 1
+        # 4. Alignment distribution (tallied in section 2)
         sections.append(f"ALIGNMENT DISTRIBUTION: {relevance_counts}")
 
         # 5. Execution gaps (with entity names)
@@ -127,24 +498,14 @@ class BenchmarkingAgent:
         total_gaps = gap_analysis.get("total_gaps", 0)
         gaps = gap_analysis.get("gaps", [])
         top_gaps = "; ".join(
-            f"{kg.get_entity_properties(g['objective_id']).get('label', g['objective_id'])}→"
-            f"{kg.get_entity_properties(g['task_group_id']).get('label', g['task_group_id'])} "
+            f"{label_of(g['objective_id'])}→"
+            f"{label_of(g['task_group_id'])} "
             f"gap={g['gap_score']:.0f} ({g['severity']})"
             for g in gaps[:5]
         )
         sections.append(f"EXECUTION GAPS: severity={overall_severity}, total={total_gaps}, top: {top_gaps or 'none'}")
 
-        # 6. Cascade / sufficiency from KG
-        cascade_strengths = {"strong": 0, "moderate": 0, "weak": 0}
-        sufficiency_levels = {"fully_sufficient": 0, "partially_sufficient": 0, "insufficient": 0}
-        for row in tg_rows:
-            tg_id = str(row["tg"]).split("#")[-1]
-            props = kg.get_entity_properties(tg_id)
-            for k, v in props.items():
-                if k.startswith("cascade_") and k.endswith("_strength"):
-                    cascade_strengths[v] = cascade_strengths.get(v, 0) + 1
-                if k.startswith("sufficiency_") and k.endswith("_level"):
-                    sufficiency_levels[v] = sufficiency_levels.get(v, 0) + 1
+        # 6. Cascade / sufficiency from KG (tallied in section 2)
         sections.append(f"CASCADE STRENGTHS: {cascade_strengths}")
         sections.append(f"SUFFICIENCY LEVELS: {sufficiency_levels}")
 
@@ -163,20 +524,14 @@ class BenchmarkingAgent:
         )
 
         # 8. KPI quality (with names)
-        kpi_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?kpi WHERE { ?kpi rdf:type bita:KPI . }
-        """
-        kpi_rows = kg.query_sparql(kpi_query)
-        kpi_total = len(kpi_rows)
+        kpi_ids = kg.subjects_of_type("KPI")
+        kpi_total = len(kpi_ids)
         kpi_with_baseline = 0
         kpi_measurable = 0
         kpi_with_owner = 0
         kpi_names = []
-        for row in kpi_rows:
-            kpi_id = str(row["kpi"]).split("#")[-1]
-            props = kg.get_entity_properties(kpi_id)
+        for kpi_id in kpi_ids:
+            props = get_props(kpi_id)
             kpi_names.append(props.get("label", kpi_id))
             if props.get("baseline"):
                 kpi_with_baseline += 1
@@ -204,64 +559,19 @@ class BenchmarkingAgent:
         Returns:
             Dictionary mapping dimension key to {verdict, reasoning}
         """
-        context = self._build_alignment_context(kg, completeness_results)
-
-        prompt = f"""You are evaluating how well an organization's actions align with its strategy.
-
-Below is a data summary from alignment analysis layers:
-
-{context}
-
-Assess these 6 alignment dimensions. For each, provide:
-- a verdict (strong / adequate / weak / critical)
-- a brief reasoning sentence
-- 1-3 specific examples from the data above that support your verdict. Each example MUST use entity titles/names (e.g., "Revenue Growth", "Sales Initiative", "Customer Satisfaction KPI"). NEVER use internal codes like G1, TG2, G1_O1, A1_2 in the examples. Write examples in plain language that a business user can understand.
-
-Dimensions:
-1. strategic_coverage — Are all objectives backed by action plans? Consider orphan counts and coverage.
-2. alignment_quality — How strong are the strategy-action links? Consider alignment relevance/strength distribution.
-3. resource_adequacy — Does resource allocation match strategic priorities? Consider execution gaps.
-4. goal_cascade_coherence — Do task goals flow logically from strategy? Consider cascade strengths and sufficiency levels.
-5. bsc_balance — Is there balanced BSC perspective coverage with causal links? Consider BSC coverage and causal link data.
-6. execution_readiness — Are actions concrete and measurable? Consider KPI quality indicators.
-
-Return ONLY valid JSON:
-{{
-  "strategic_coverage": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
-  "alignment_quality": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
-  "resource_adequacy": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
-  "goal_cascade_coherence": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
-  "bsc_balance": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}},
-  "execution_readiness": {{"verdict": "...", "reasoning": "...", "examples": ["..."]}}
-}}
-
-JSON OUTPUT:"""
-
-        response = self.llm.invoke(prompt)
-        content = response.content.strip()
-
-        log_llm_call(
-            caller="BenchmarkingAgent.assess_alignment",
-            prompt=prompt,
-            response=content,
-            layer=4,
+        content, prompt, key = self._invoke(
+            "BenchmarkingAgent.assess_alignment",
+            "benchmark_alignment",
+            _ASSESS_ALIGNMENT_PROMPT,
+            self._build_alignment_context,
+            kg,
+            completeness_results,
         )
 
-        # Strip markdown fences
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json:
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
         try:
-            result = json.loads(content)
+            result = loads(content)
+            if key and isinstance(result, dict):
+                store_cached_result("benchmark_alignment", key, content)
         except json.JSONDecodeError as e:
             log_llm_call(
                 caller="BenchmarkingAgent.assess_alignment",
@@ -273,20 +583,10 @@ JSON OUTPUT:"""
             result = {}
 
         # Validate: ensure all 6 keys present with valid verdicts and examples
+        if not isinstance(result, dict):
+            result = {}
         for dim_key in ALIGNMENT_DIMENSIONS:
-            if dim_key not in result or not isinstance(result[dim_key], dict):
-                result[dim_key] = {"verdict": "weak", "reasoning": "Unable to assess (data unavailable).", "examples": []}
-            else:
-                verdict = result[dim_key].get("verdict", "").lower()
-                if verdict not in VALID_VERDICTS:
-                    result[dim_key]["verdict"] = "weak"
-                else:
-                    result[dim_key]["verdict"] = verdict
-                # Ensure examples is a list of strings
-                examples = result[dim_key].get("examples", [])
-                if not isinstance(examples, list):
-                    examples = []
-                result[dim_key]["examples"] = [str(e) for e in examples if e]
+            result[dim_key] = _normalize_dimension(result.get(dim_key))
 
         return result
 
@@ -299,180 +599,154 @@ JSON OUTPUT:"""
         orphans, execution gaps, BSC data, and cascade/sufficiency info.
         Names are presented first for readability.
         """
-        sections = []
+        get_props, label_of = self._entity_lookups(kg)
+        # Sections are written straight into one buffer instead of being
+        # joined per section and then joined again at the end
+        buf = io.StringIO()
+
+        def write_section(header: str, lines: list[str] | None = None) -> None:
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(header)
+            for line in lines or ():
+                buf.write("\n")
+                buf.write(line)
+
+        # Goals with their objectives (one OPTIONAL join) and task groups,
+        # fetched once and indexed locally instead of re-queried per goal /
+        # objective / orphan
+        goal_objectives: dict[str, list[str]] = {}
+        obj_to_parent: dict[str, str] = {}
+        for row in kg.query_sparql(_GOAL_OBJECTIVES_QUERY):
+            g_id = local_name(row["g"])
+            o_ids = goal_objectives.setdefault(g_id, [])
+            if "o" in row:
+                o_id = local_name(row["o"])
+                o_ids.append(o_id)
+                obj_to_parent.setdefault(o_id, g_id)
+
+        tg_props_all: list[tuple[str, dict]] = []
+        tg_parts: dict[str, tuple[dict, dict, dict]] = {}
+        # Inverted index: objective -> supporting task group descriptions
+        obj_to_supporting_tgs: dict[str, list[str]] = {}
+        for tg_id in kg.subjects_of_type("TaskGroup"):
+            props = get_props(tg_id)
+            tg_props_all.append((tg_id, props))
+            tg_parts[tg_id] = _partition_props(props)
+            tg_label = props.get("label", tg_id)
+            for o_id, relevance in tg_parts[tg_id][0].items():
+                obj_to_supporting_tgs.setdefault(o_id, []).append(
+                    f"{tg_label} (relevance={relevance}, strength={props.get(f'alignment_{o_id}_strength', 'N/A')})"
+                )
 
         # 1. Goals with objectives
-        goal_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?g WHERE { ?g rdf:type bita:Goal . }
-        """
-        goal_rows = kg.query_sparql(goal_query)
         goal_lines = []
         goal_map = {}  # goal_id -> props for reuse
-        for row in goal_rows:
-            g_id = str(row["g"]).split("#")[-1]
-            props = kg.get_entity_properties(g_id)
+        for g_id, o_ids in goal_objectives.items():
+            props = get_props(g_id)
             goal_map[g_id] = props
             g_label = props.get("label", g_id)
-            # Find objectives under this goal
-            obj_query = f"""
-            PREFIX bita: <http://bita-system.org/ontology#>
-            SELECT ?o WHERE {{ bita:{g_id} bita:hasObjective ?o . }}
-            """
-            obj_rows = kg.query_sparql(obj_query)
-            obj_names = []
-            for orow in obj_rows:
-                o_id = str(orow["o"]).split("#")[-1]
-                oprops = kg.get_entity_properties(o_id)
-                obj_names.append(oprops.get("label", o_id))
+            # Objectives under this goal
+            obj_names = [label_of(o_id) for o_id in o_ids]
             goal_lines.append(
                 f"- {g_label}, "
-                f"description={props.get('description', 'N/A')}, "
-                f"importance={props.get('strategicImportance', 'N/A')}, "
-                f"bsc={props.get('bscPerspective', 'N/A')}, "
+                f"description={props['description']}, "
+                f"importance={props['strategicImportance']}, "
+                f"bsc={props['bscPerspective']}, "
                 f"objectives=[{', '.join(obj_names) if obj_names else 'none'}]"
             )
-        sections.append(f"GOALS ({len(goal_lines)}):\n" + "\n".join(goal_lines) if goal_lines else "GOALS: None found")
+        write_section(f"GOALS ({len(goal_lines)}):" if goal_lines else "GOALS: None found", goal_lines)
 
         # 2. Objectives summary
-        obj_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?obj WHERE { ?obj rdf:type bita:Objective . }
-        """
-        obj_rows = kg.query_sparql(obj_query)
         obj_lines = []
-        for row in obj_rows:
-            obj_id = str(row["obj"]).split("#")[-1]
-            props = kg.get_entity_properties(obj_id)
+        for obj_id in kg.subjects_of_type("Objective"):
+            props = get_props(obj_id)
             obj_label = props.get("label", obj_id)
-            # Find parent goal
-            parent_query = f"""
-            PREFIX bita: <http://bita-system.org/ontology#>
-            SELECT ?g WHERE {{ ?g bita:hasObjective bita:{obj_id} . }}
-            """
-            parent_rows = kg.query_sparql(parent_query)
-            parent_id = str(parent_rows[0]["g"]).split("#")[-1] if parent_rows else "N/A"
+            # Parent goal
+            parent_id = obj_to_parent.get(obj_id, "N/A")
             parent_label = goal_map.get(parent_id, {}).get("label", parent_id)
-            # Find supporting task groups
-            support_tgs = []
-            tg_query2 = """
-            PREFIX bita: <http://bita-system.org/ontology#>
-            PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-            SELECT ?tg WHERE { ?tg rdf:type bita:TaskGroup . }
-            """
-            for tg_row in kg.query_sparql(tg_query2):
-                tg_id = str(tg_row["tg"]).split("#")[-1]
-                tg_props = kg.get_entity_properties(tg_id)
-                rel_key = f"alignment_{obj_id}_relevance"
-                if rel_key in tg_props:
-                    tg_label = tg_props.get("label", tg_id)
-                    support_tgs.append(f"{tg_label} (relevance={tg_props[rel_key]}, strength={tg_props.get(f'alignment_{obj_id}_strength', 'N/A')})")
+            # Supporting task groups
+            support_tgs = obj_to_supporting_tgs.get(obj_id, [])
             obj_lines.append(
                 f"- {obj_label}, "
                 f"parent_goal={parent_label}, "
-                f"importance={props.get('strategicImportance', 'N/A')}, "
+                f"importance={props['strategicImportance']}, "
                 f"supporting_task_groups=[{', '.join(support_tgs) if support_tgs else 'none'}]"
             )
-        sections.append(f"OBJECTIVES ({len(obj_lines)}):\n" + "\n".join(obj_lines) if obj_lines else "OBJECTIVES: None found")
+        write_section(f"OBJECTIVES ({len(obj_lines)}):" if obj_lines else "OBJECTIVES: None found", obj_lines)
 
         # 3. Task groups with full context
-        tg_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?tg WHERE { ?tg rdf:type bita:TaskGroup . }
-        """
-        tg_rows = kg.query_sparql(tg_query)
+        # Child task counts for all task groups in one aggregate query
+        tg_task_counts = {
+            local_name(row["tg"]): int(row["cnt"])
+            for row in kg.query_sparql(_TASK_COUNTS_QUERY)
+        }
         tg_lines = []
-        for row in tg_rows:
-            tg_id = str(row["tg"]).split("#")[-1]
-            props = kg.get_entity_properties(tg_id)
+        for tg_id, props in tg_props_all:
             tg_label = props.get("label", tg_id)
-            supported = []
-            for k, v in props.items():
-                if k.startswith("alignment_") and k.endswith("_relevance"):
-                    o_id = k.replace("alignment_", "").replace("_relevance", "")
-                    o_props = kg.get_entity_properties(o_id)
-                    o_label = o_props.get("label", o_id)
-                    supported.append(f"{o_label} (relevance={v}, strength={props.get(f'alignment_{o_id}_strength', 'N/A')})")
-            # Count child tasks
-            task_query = f"""
-            PREFIX bita: <http://bita-system.org/ontology#>
-            SELECT (COUNT(?t) AS ?cnt) WHERE {{ bita:{tg_id} bita:hasTask ?t . }}
-            """
-            task_rows = kg.query_sparql(task_query)
-            task_count = int(task_rows[0]["cnt"]) if task_rows else 0
+            supported = [
+                f"{label_of(o_id)} (relevance={v}, strength={props.get(f'alignment_{o_id}_strength', 'N/A')})"
+                for o_id, v in tg_parts[tg_id][0].items()
+            ]
+            task_count = tg_task_counts.get(tg_id, 0)
             tg_lines.append(
                 f"- {tg_label}, "
-                f"purpose={props.get('intendedPurpose', 'N/A')}, "
-                f"allocation={props.get('resourceAllocation', 'N/A')}, "
+                f"purpose={props['intendedPurpose']}, "
+                f"allocation={props['resourceAllocation']}, "
                 f"tasks={task_count}, "
                 f"supports=[{', '.join(supported) if supported else 'none'}]"
             )
-        sections.append(f"TASK GROUPS ({len(tg_lines)}):\n" + "\n".join(tg_lines) if tg_lines else "TASK GROUPS: None found")
+        write_section(f"TASK GROUPS ({len(tg_lines)}):" if tg_lines else "TASK GROUPS: None found", tg_lines)
 
         # 4. KPIs
-        kpi_query = """
-        PREFIX bita: <http://bita-system.org/ontology#>
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        SELECT ?kpi WHERE { ?kpi rdf:type bita:KPI . }
-        """
-        kpi_rows = kg.query_sparql(kpi_query)
         kpi_lines = []
-        for row in kpi_rows:
-            kpi_id = str(row["kpi"]).split("#")[-1]
-            props = kg.get_entity_properties(kpi_id)
+        for kpi_id in kg.subjects_of_type("KPI"):
+            props = get_props(kpi_id)
             kpi_label = props.get("label", kpi_id)
             kpi_lines.append(
                 f"- {kpi_label}, "
-                f"type={props.get('kpiType', 'N/A')}, "
-                f"owner={props.get('owner', 'N/A')}, "
-                f"baseline={props.get('baseline', 'N/A')}, "
-                f"measurability={props.get('measurability', 'N/A')}"
+                f"type={props['kpiType']}, "
+                f"owner={props['owner']}, "
+                f"baseline={props['baseline']}, "
+                f"measurability={props['measurability']}"
             )
-        sections.append(f"KPIs ({len(kpi_lines)}):\n" + "\n".join(kpi_lines) if kpi_lines else "KPIs: None found")
+        write_section(f"KPIs ({len(kpi_lines)}):" if kpi_lines else "KPIs: None found", kpi_lines)
 
         # 5. Orphan objectives with context
         orphan_objs = completeness_results.get("orphan_objectives", [])
         if orphan_objs:
             orphan_lines = []
             for obj_id in orphan_objs:
-                props = kg.get_entity_properties(obj_id)
+                props = get_props(obj_id)
                 obj_label = props.get("label", obj_id)
-                parent_query = f"""
-                PREFIX bita: <http://bita-system.org/ontology#>
-                SELECT ?g WHERE {{ ?g bita:hasObjective bita:{obj_id} . }}
-                """
-                parent_rows = kg.query_sparql(parent_query)
-                parent_id = str(parent_rows[0]["g"]).split("#")[-1] if parent_rows else "N/A"
-                parent_props = goal_map.get(parent_id, {})
+                parent_id = obj_to_parent.get(obj_id, "N/A")
+                parent_props = goal_map.get(parent_id) or _PropsOrNA()
                 parent_label = parent_props.get("label", parent_id)
                 orphan_lines.append(
                     f"- {obj_label}, "
                     f"parent_goal={parent_label}, "
-                    f"bsc={parent_props.get('bscPerspective', 'N/A')}, "
-                    f"importance={props.get('strategicImportance', parent_props.get('strategicImportance', 'N/A'))}"
+                    f"bsc={parent_props['bscPerspective']}, "
+                    f"importance={props.get('strategicImportance', parent_props['strategicImportance'])}"
                 )
-            sections.append(f"ORPHAN OBJECTIVES ({len(orphan_lines)}):\n" + "\n".join(orphan_lines))
+            write_section(f"ORPHAN OBJECTIVES ({len(orphan_lines)}):", orphan_lines)
         else:
-            sections.append("ORPHAN OBJECTIVES: None")
+            write_section("ORPHAN OBJECTIVES: None")
 
         # 6. Orphan task groups with context
         orphan_tasks = completeness_results.get("orphan_tasks", [])
         if orphan_tasks:
             orphan_tg_lines = []
             for tg_id in orphan_tasks:
-                props = kg.get_entity_properties(tg_id)
+                props = get_props(tg_id)
                 tg_label = props.get("label", tg_id)
                 orphan_tg_lines.append(
                     f"- {tg_label}, "
-                    f"purpose={props.get('intendedPurpose', 'N/A')}, "
-                    f"allocation={props.get('resourceAllocation', 'N/A')}"
+                    f"purpose={props['intendedPurpose']}, "
+                    f"allocation={props['resourceAllocation']}"
                 )
-            sections.append(f"ORPHAN TASK GROUPS ({len(orphan_tg_lines)}):\n" + "\n".join(orphan_tg_lines))
+            write_section(f"ORPHAN TASK GROUPS ({len(orphan_tg_lines)}):", orphan_tg_lines)
         else:
-            sections.append("ORPHAN TASK GROUPS: None")
+            write_section("ORPHAN TASK GROUPS: None")
 
         # 7. Execution gaps with entity names
         gap_analysis = completeness_results.get("gap_analysis", {})
@@ -482,19 +756,19 @@ JSON OUTPUT:"""
             for g in gaps:
                 obj_id = g["objective_id"]
                 tg_id = g["task_group_id"]
-                obj_label = kg.get_entity_properties(obj_id).get("label", obj_id)
-                tg_label = kg.get_entity_properties(tg_id).get("label", tg_id)
+                obj_label = label_of(obj_id)
+                tg_label = label_of(tg_id)
                 gap_lines.append(
                     f"- {obj_label} → {tg_label}: "
                     f"importance={g['importance']}, allocation={g['allocation']}, "
                     f"gap={g['gap_score']:.0f}, severity={g['severity']}"
                 )
-            sections.append(
-                f"EXECUTION GAPS ({len(gap_lines)}, overall={gap_analysis.get('overall_severity', 'low')}):\n"
-                + "\n".join(gap_lines)
+            write_section(
+                f"EXECUTION GAPS ({len(gap_lines)}, overall={gap_analysis.get('overall_severity', 'low')}):",
+                gap_lines,
             )
         else:
-            sections.append("EXECUTION GAPS: None")
+            write_section("EXECUTION GAPS: None")
 
         # 8. BSC balance + causal links
         bsc = completeness_results.get("bsc_analysis", {})
@@ -505,29 +779,25 @@ JSON OUTPUT:"""
             f"{l['source_name']}({l['source_perspective']})→{l['target_name']}({l['target_perspective']}) [{l['strength']}]"
             for l in causal_links[:8]
         )
-        sections.append(
+        write_section(
             f"BSC BALANCE: coverage={coverage}, missing={missing}, "
             f"causal_links={len(causal_links)} [{causal_summary}]"
         )
 
         # 9. Cascade / sufficiency (with names)
         cascade_details = []
-        for row in tg_rows:
-            tg_id = str(row["tg"]).split("#")[-1]
-            props = kg.get_entity_properties(tg_id)
+        for tg_id, props in tg_props_all:
             tg_label = props.get("label", tg_id)
-            for k, v in props.items():
-                if k.startswith("cascade_") and k.endswith("_strength"):
-                    o_id = k.replace("cascade_", "").replace("_strength", "")
-                    o_label = kg.get_entity_properties(o_id).get("label", o_id)
-                    suf_key = f"sufficiency_{o_id}_level"
-                    cascade_details.append(
-                        f"- {tg_label}→{o_label}: cascade={v}, sufficiency={props.get(suf_key, 'N/A')}"
-                    )
+            _, cascade, sufficiency = tg_parts[tg_id]
+            for o_id, v in cascade.items():
+                o_label = label_of(o_id)
+                cascade_details.append(
+                    f"- {tg_label}→{o_label}: cascade={v}, sufficiency={sufficiency.get(o_id, 'N/A')}"
+                )
         if cascade_details:
-            sections.append(f"CASCADE & SUFFICIENCY:\n" + "\n".join(cascade_details))
+            write_section("CASCADE & SUFFICIENCY:", cascade_details)
 
-        return "\n\n".join(sections)
+        return buf.getvalue()
 
     def generate_recommendations(
         self, kg: KnowledgeGraph, completeness_results: dict
@@ -541,57 +811,21 @@ JSON OUTPUT:"""
         Returns:
             List of recommendation dictionaries with structured fields
         """
-        context = self._build_recommendations_context(kg, completeness_results)
-
-        prompt = f"""You are an expert in Business-IT Alignment and Balanced Scorecard strategy.
-
-Below is a detailed data summary of an organization's strategic plan analysis, including goals, objectives, task groups, KPIs, orphans, execution gaps, BSC coverage, and cascade data.
-
-{context}
-
-Based on this data, generate 4-8 specific, actionable recommendations. Each recommendation MUST reference actual entity names/titles from the data above (not generic advice).
-
-IMPORTANT: In all text fields (title, gap_description, business_impact, recommended_actions), always use entity titles/names (e.g., "Revenue Growth", "Sales Initiative"). NEVER use internal codes like G1, TG2, G1_O1, A1_2. Write in plain language that a business user can understand. The only place codes should appear is in the "affected_entities" array.
-
-Return ONLY a valid JSON array. Each element must have these fields:
-- "title": Short entity-specific title using names (e.g., "Allocate Resources for Digital Transformation Initiative")
-- "category": one of "orphan_objective" | "orphan_task" | "resource_gap" | "bsc_gap" | "alignment_weakness" | "kpi_quality"
-- "priority": one of "critical" | "high" | "medium" | "low"
-- "priority_reasoning": Why this priority level
-- "gap_description": What the gap is, referencing specific entity names (not codes)
-- "business_impact": Why this gap matters for the organization
-- "recommended_actions": Array of 2-3 specific actionable steps using entity names
-- "affected_entities": Array of entity IDs involved (e.g., ["G1", "TG2", "O1"])
-
-JSON OUTPUT:"""
-
-        response = self.llm.invoke(prompt)
-        content = response.content.strip()
-
-        log_llm_call(
-            caller="BenchmarkingAgent.generate_recommendations",
-            prompt=prompt,
-            response=content,
-            layer=4,
+        content, prompt, key = self._invoke(
+            "BenchmarkingAgent.generate_recommendations",
+            "recommendations",
+            _RECOMMENDATIONS_PROMPT,
+            self._build_recommendations_context,
+            kg,
+            completeness_results,
         )
 
-        # Strip markdown fences
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json:
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
         try:
-            result = json.loads(content)
+            result = loads(content)
             if not isinstance(result, list):
                 raise ValueError("Expected JSON array")
+            if key:
+                store_cached_result("recommendations", key, content)
         except (json.JSONDecodeError, ValueError) as e:
             log_llm_call(
                 caller="BenchmarkingAgent.generate_recommendations",
@@ -631,101 +865,56 @@ JSON OUTPUT:"""
     ) -> list[dict[str, Any]]:
         """Generate rule-based recommendations when LLM call fails.
 
+        Execution gaps are rescored from the KG rather than read from
+        completeness_results, to get them in column form.
+
         Args:
             kg: KnowledgeGraph instance
-            completeness_results: Results from Layer 3
+            completeness_results: Results from Layer 3 (orphans, BSC gaps)
 
         Returns:
             List of recommendation dictionaries
         """
+        get_props, label_of = self._entity_lookups(kg)
         recommendations = []
 
-        # Orphan objectives
-        orphan_objs = completeness_results.get("orphan_objectives", [])
-        for obj_id in orphan_objs:
-            props = kg.get_entity_properties(obj_id)
-            name = props.get("label", obj_id)
-            recommendations.append({
-                "title": f"Create Action Plan for '{name}'",
-                "category": "orphan_objective",
-                "priority": "high",
-                "priority_reasoning": "Objectives without supporting tasks cannot be executed.",
-                "gap_description": f"Objective '{name}' ({obj_id}) has no supporting task groups assigned to it.",
-                "business_impact": f"Without action plans, the objective '{name}' remains aspirational and will not translate into operational outcomes.",
-                "recommended_actions": [
-                    f"Identify or create task groups that can support '{name}'.",
-                    f"Assign appropriate resource allocation to new task groups.",
-                    f"Define KPIs to track progress toward '{name}'.",
-                ],
-                "affected_entities": [obj_id],
-            })
-
-        # Orphan tasks
-        orphan_tasks = completeness_results.get("orphan_tasks", [])
-        for tg_id in orphan_tasks:
-            props = kg.get_entity_properties(tg_id)
-            name = props.get("label", tg_id)
-            purpose = props.get("intendedPurpose", "N/A")
-            recommendations.append({
-                "title": f"Align '{name}' to Strategic Objectives",
-                "category": "orphan_task",
-                "priority": "medium",
-                "priority_reasoning": "Unaligned task groups consume resources without strategic justification.",
-                "gap_description": f"Task group '{name}' ({tg_id}, purpose: {purpose}) has no alignment to any strategic objective.",
-                "business_impact": f"Resources allocated to '{name}' may be wasted if not aligned to organizational strategy.",
-                "recommended_actions": [
-                    f"Review the intended purpose of '{name}' and map it to relevant objectives.",
-                    f"If no strategic fit exists, consider reallocating its resources.",
-                ],
-                "affected_entities": [tg_id],
-            })
+        # Orphan objectives and orphan tasks
+        recommendations.extend(
+            _orphan_objective_recommendation(obj_id, get_props(obj_id))
+            for obj_id in completeness_results.get("orphan_objectives", [])
+        )
+        recommendations.extend(
+            _orphan_task_recommendation(tg_id, get_props(tg_id))
+            for tg_id in completeness_results.get("orphan_tasks", [])
+        )
 
         # BSC gaps
         bsc = completeness_results.get("bsc_analysis", {})
         missing = bsc.get("missing_perspectives", [])
         if missing:
-            recommendations.append({
-                "title": f"Address Missing BSC Perspectives: {', '.join(missing)}",
-                "category": "bsc_gap",
-                "priority": "high",
-                "priority_reasoning": "Unbalanced BSC coverage leads to strategic blind spots.",
-                "gap_description": f"The strategic plan lacks goals in {len(missing)} BSC perspective(s): {', '.join(missing)}.",
-                "business_impact": "An unbalanced strategy risks neglecting critical areas, leading to unsustainable performance.",
-                "recommended_actions": [
-                    f"Define at least one strategic goal for each missing perspective: {', '.join(missing)}.",
+            missing_list = ", ".join(missing)
+            recommendations.append(_recommendation(
+                _BSC_GAP_TEMPLATE,
+                title=f"Address Missing BSC Perspectives: {missing_list}",
+                gap_description=f"The strategic plan lacks goals in {len(missing)} BSC perspective(s): {missing_list}.",
+                recommended_actions=[
+                    f"Define at least one strategic goal for each missing perspective: {missing_list}.",
                     "Ensure new goals have measurable objectives and KPIs.",
                     "Assign task groups to support the new goals.",
                 ],
-                "affected_entities": [f"BSC_{p.replace(' ', '').replace('&', '')}" for p in missing],
-            })
-
-        # Execution gaps
-        gap_analysis = completeness_results.get("gap_analysis", {})
-        gaps = gap_analysis.get("gaps", [])
-        for gap in gaps:
-            if gap["severity"] in ("critical", "high"):
-                obj_id = gap["objective_id"]
-                tg_id = gap["task_group_id"]
-                obj_props = kg.get_entity_properties(obj_id)
-                tg_props = kg.get_entity_properties(tg_id)
-                obj_name = obj_props.get("label", obj_id)
-                tg_name = tg_props.get("label", tg_id)
-                recommendations.append({
-                    "title": f"Increase Resources for '{tg_name}' Supporting '{obj_name}'",
-                    "category": "resource_gap",
-                    "priority": gap["severity"],
-                    "priority_reasoning": f"Gap score of {gap['gap_score']:.0f} indicates significant resource-importance mismatch.",
-                    "gap_description": (
-                        f"'{tg_name}' ({tg_id}) supports '{obj_name}' ({obj_id}) but has "
-                        f"allocation={gap['allocation']} vs importance={gap['importance']} (gap={gap['gap_score']:.0f})."
-                    ),
-                    "business_impact": f"Under-resourcing '{tg_name}' jeopardizes achievement of '{obj_name}'.",
-                    "recommended_actions": [
-                        f"Increase resource allocation for '{tg_name}' from {gap['allocation']} to match strategic importance.",
-                        f"Review and optimize task priorities within '{tg_name}'.",
-                    ],
-                    "affected_entities": [obj_id, tg_id],
-                })
+                affected_entities=[f"BSC_{p.replace(' ', '').replace('&', '')}" for p in missing],
+            ))
+
+        # Execution gaps rated high or critical, picked with one compare on
+        # the severity column (rows line up with the gap list)
+        gap_analysis, gap_columns = CompletenessAnalyzer.analyze_execution_gap(kg, columns=True)
+        gaps = gap_analysis["gaps"]
+        recommendations.extend(
+            _resource_gap_recommendation(
+                gaps[i], label_of(gaps[i]["objective_id"]), label_of(gaps[i]["task_group_id"])
+            )
+            for i in (gap_columns["severity_idx"] >= HIGH_SEVERITY_IDX).nonzero()[0].tolist()
+        )
 
         return recommendations
 
@@ -744,14 +933,30 @@ JSON OUTPUT:"""
         print("\n[Layer 4] Benchmarking & Recommendations")
         print("-" * 80)
 
-        # 1. Alignment assessment
-        print("\nAssessing strategy-to-action alignment...")
-        alignment_assessment = self.assess_alignment(kg, completeness_results)
+        # Build any contexts that will be needed here so the worker threads
+        # only wait on the LLM (skipped when the answer is already cached);
+        # the two calls are independent, so Layer 4 takes as long as the
+        # slower one rather than their sum
+        for namespace, template, builder in (
+            ("benchmark_alignment", _ASSESS_ALIGNMENT_PROMPT, self._build_alignment_context),
+            ("recommendations", _RECOMMENDATIONS_PROMPT, self._build_recommendations_context),
+        ):
+            if not self.cache_responses or load_cached_result(
+                namespace, self._response_cache_key(template, kg, completeness_results)
+            ) is None:
+                self._get_context(namespace, builder, kg, completeness_results)
+
+        print("\nAssessing strategy-to-action alignment and generating improvement recommendations...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # 1. Alignment assessment
+            alignment_future = executor.submit(self.assess_alignment, kg, completeness_results)
+            # 2. Generate recommendations
+            recommendations_future = executor.submit(
+                self.generate_recommendations, kg, completeness_results
+            )
+            alignment_assessment = alignment_future.result()
+            recommendations = recommendations_future.result()
         print(f"✓ Assessed {len(alignment_assessment)} alignment dimensions")
-
-        # 2. Generate recommendations
-        print("\nGenerating improvement recommendations...")
-        recommendations = self.generate_recommendations(kg, completeness_results)
         print(f"✓ Generated {len(recommendations)} recommendations")
 
         return {
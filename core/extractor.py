@@ -4,11 +4,200 @@ Extracts structured data from strategic and action plans.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from .ingestion import ACTION_DOCUMENT_SEPARATOR
 from .knowledge_graph import KnowledgeGraph
-from .llm_factory import DEFAULT_PROVIDER, LLM_PROVIDERS, create_llm
+from .llm_factory import DEFAULT_PROVIDER, LLM_PROVIDERS, build_cached_messages, create_llm
 from .llm_logger import log_llm_call
+from .llm_parsing import loads_lenient
+
+# Extraction instructions, sent as a cacheable prefix ahead of the document
+# text; must stay byte-identical across calls for the provider to reuse it
+_STRATEGIC_INSTRUCTIONS = """Extract structured data from the following strategic plan document.
+
+For each strategic goal (high-level direction), extract:
+- goal_id: A short alphanumeric identifier (MUST follow format "G1", "G2", "G3", etc.)
+- goal_name: Short name of the goal
+- description: Detailed description
+- objectives: List of objects, each with:
+  - name: Short name of the objective
+  - description: Detailed description of what the objective entails and how success is measured
+- kpis: List of KPIs with name, baseline_exists (bool), owner (string or null), type (leading/lagging), measurable (bool)
+- bsc_perspective: One of: financial, customer, internal_process, learning_growth
+- strategic_importance: One of: critical, high, moderate, low, negligible
+- importance_reasoning: 1-2 sentence explanation for the importance classification
+- target_segments: List of markets, verticals, or customer segments
+- timeline: Time period as string
+- dependencies: List of goal IDs this depends on"""
+
+_ACTION_INSTRUCTIONS = f"""Extract structured data from the following action plan document.
+The text may hold several action plan documents separated by "{ACTION_DOCUMENT_SEPARATOR}"; extract the task groups of every document into the same array, with task_group_id values unique across documents.
+
+For each task group, extract:
+- task_group_id: A short alphanumeric identifier (MUST follow format "A1_1", "A2_1", "A1_2", etc.)
+- task_group_name: Short name of the task group
+- phase: Which phase this belongs to (e.g., "Phase 1: Core Development")
+- resource_allocation: One of: heavy, moderate, light, minimal
+- allocation_reasoning: 1-2 sentence explanation for the allocation classification
+- tasks: List of ALL individual tasks (extract every task mentioned, do not summarize or group) with:
+  - name: Short name of the task
+  - description: Detailed description of what the task involves and its expected deliverables
+  - assignee: Person or team (string or null)
+  - deadline: Deadline as string
+  - status: One of: pending, in_progress, completed
+  - measurable_outcome: What defines success
+  - has_business_justification: boolean
+- intended_strategic_purpose: Brief description of which strategic goal this serves"""
+
+# Structured-output schemas; the provider returns the extracted items as
+# tool arguments (Anthropic tool use, OpenAI json_schema mode) instead of
+# free-form JSON text. Field semantics are spelled out in the instructions.
+_NULLABLE_STRING = {"type": ["string", "null"]}
+
+STRATEGIC_PLAN_SCHEMA = {
+    "title": "strategic_plan",
+    "description": "Strategic goals extracted from a strategic plan document",
+    "type": "object",
+    "properties": {
+        "goals": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "goal_id": {"type": "string"},
+                    "goal_name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "objectives": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "description": {"type": "string"},
+                            },
+                            "required": ["name", "description"],
+                        },
+                    },
+                    "kpis": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "baseline_exists": {"type": "boolean"},
+                                "owner": _NULLABLE_STRING,
+                                "type": {"type": "string", "enum": ["leading", "lagging"]},
+                                "measurable": {"type": "boolean"},
+                            },
+                            "required": ["name", "baseline_exists", "type", "measurable"],
+                        },
+                    },
+                    "bsc_perspective": {
+                        "type": "string",
+                        "enum": ["financial", "customer", "internal_process", "learning_growth"],
+                    },
+                    "strategic_importance": {
+                        "type": "string",
+                        "enum": ["critical", "high", "moderate", "low", "negligible"],
+                    },
+                    "importance_reasoning": {"type": "string"},
+                    "target_segments": {"type": "array", "items": {"type": "string"}},
+                    "timeline": {"type": "string"},
+                    "dependencies": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": [
+                    "goal_id",
+                    "goal_name",
+                    "description",
+                    "objectives",
+                    "kpis",
+                    "bsc_perspective",
+                    "strategic_importance",
+                    "importance_reasoning",
+                ],
+            },
+        },
+    },
+    "required": ["goals"],
+}
+
+ACTION_PLAN_SCHEMA = {
+    "title": "action_plan",
+    "description": "Task groups extracted from one or more action plan documents",
+    "type": "object",
+    "properties": {
+        "task_groups": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "task_group_id": {"type": "string"},
+                    "task_group_name": {"type": "string"},
+                    "phase": {"type": "string"},
+                    "resource_allocation": {
+                        "type": "string",
+                        "enum": ["heavy", "moderate", "light", "minimal"],
+                    },
+                    "allocation_reasoning": {"type": "string"},
+                    "tasks": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string"},
+                                "description": {"type": "string"},
+                                "assignee": _NULLABLE_STRING,
+                                "deadline": {"type": "string"},
+                                "status": {
+                                    "type": "string",
+                                    "enum": ["pending", "in_progress", "completed"],
+                                },
+                                "measurable_outcome": {"type": "string"},
+                                "has_business_justification": {"type": "boolean"},
+                            },
+                            "required": ["name", "description", "status"],
+                        },
+                    },
+                    "intended_strategic_purpose": {"type": "string"},
+                },
+                "required": [
+                    "task_group_id",
+                    "task_group_name",
+                    "phase",
+                    "resource_allocation",
+                    "allocation_reasoning",
+                    "tasks",
+                    "intended_strategic_purpose",
+                ],
+            },
+        },
+    },
+    "required": ["task_groups"],
+}
+
+# Extracted bsc_perspective value -> BSC perspective entity
+_BSC_MAPPING = {
+    "financial": "BSC_Financial",
+    "customer": "BSC_Customer",
+    "internal_process": "BSC_InternalProcess",
+    "learning_growth": "BSC_LearningGrowth",
+}
+
+# Caller names recorded in the LLM log
+_STRATEGIC_CALLER = "StructuredExtractor.extract_strategic_plan"
+_ACTION_CALLER = "StructuredExtractor.extract_action_plan"
+
+
+def _usage_log_fields(response: Any) -> dict[str, int | None]:
+    """Token counts from a chat model response, as log_llm_call arguments."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    return {
+        "input_tokens": usage.get("input_tokens"),
+        "output_tokens": usage.get("output_tokens"),
+        "cache_read_tokens": (usage.get("input_token_details") or {}).get("cache_read"),
+    }
 
 
 class StructuredExtractor:
@@ -30,6 +219,80 @@ class StructuredExtractor:
             api_key=api_key,
             temperature=0.0,  # Deterministic for extraction
         )
+        self.structured_strategic_llm = self.llm.with_structured_output(
+            STRATEGIC_PLAN_SCHEMA, include_raw=True
+        )
+        self.structured_action_llm = self.llm.with_structured_output(
+            ACTION_PLAN_SCHEMA, include_raw=True
+        )
+        self.provider = provider
+        self.model = model
+
+    def _request(self, instructions: str, heading: str, text: str) -> tuple[str, list]:
+        """Build one extraction request.
+
+        Returns:
+            Tuple of (per-call prompt text, chat messages to send). As in
+            Layer 2, only the per-call part is logged; the instructions
+            prefix is constant and would be a full document-sized copy.
+        """
+        document = f"""{heading}:
+{text}"""
+        return document, build_cached_messages(self.provider, instructions, document)
+
+    def _parse_extraction(
+        self, caller: str, prompt: str, response: dict, items_key: str
+    ) -> list[dict[str, Any]]:
+        """Log a structured extraction response and return its items.
+
+        Args:
+            caller: Extraction method, for the LLM log
+            prompt: Per-call prompt text, for the LLM log
+            response: Output of a structured LLM with include_raw=True
+            items_key: Schema property holding the extracted array
+
+        Returns:
+            Extracted items ([] if no structured output could be recovered)
+        """
+        result = response["parsed"]
+        raw = response["raw"]
+        usage = _usage_log_fields(raw)
+
+        if result is None and isinstance(raw.content, str) and raw.content:
+            # Salvage a model that answered in JSON text instead
+            try:
+                result = loads_lenient(raw.content)
+            except json.JSONDecodeError:
+                pass
+        if isinstance(result, list):
+            # Bare array of items
+            result = {items_key: result}
+
+        if not isinstance(result, dict) or not isinstance(result.get(items_key), list):
+            raw_text = raw.content if isinstance(raw.content, str) else json.dumps(raw.content)
+            error = str(response.get("parsing_error") or "No structured output returned")
+            log_llm_call(
+                caller=caller,
+                prompt=prompt,
+                response=raw_text,
+                error=error,
+                layer=1,
+                model=self.model,
+                **usage,
+            )
+            print(f"Failed to parse LLM extraction output: {error}")
+            print(f"Output was: {raw_text[:500]}")
+            return []
+
+        log_llm_call(
+            caller=caller,
+            prompt=prompt,
+            response=json.dumps(result),
+            layer=1,
+            model=self.model,
+            **usage,
+        )
+        return result[items_key]
 
     def extract_strategic_plan(self, text: str) -> list[dict[str, Any]]:
         """Extract strategic goals from strategic plan text.
@@ -40,118 +303,47 @@ class StructuredExtractor:
         Returns:
             List of strategic goal dictionaries
         """
-        prompt = f"""Extract structured data from the following strategic plan document.
-
-For each strategic goal (high-level direction), extract:
-- goal_id: A short alphanumeric identifier (MUST follow format "G1", "G2", "G3", etc.)
-- goal_name: Short name of the goal
-- description: Detailed description
-- objectives: List of objects, each with:
-  - name: Short name of the objective
-  - description: Detailed description of what the objective entails and how success is measured
-- kpis: List of KPIs with name, baseline_exists (bool), owner (string or null), type (leading/lagging), measurable (bool)
-- bsc_perspective: One of: financial, customer, internal_process, learning_growth
-- strategic_importance: One of: critical, high, moderate, low, negligible
-- importance_reasoning: 1-2 sentence explanation for the importance classification
-- target_segments: List of markets, verticals, or customer segments
-- timeline: Time period as string
-- dependencies: List of goal IDs this depends on
-
-Return ONLY valid JSON array of goals, no other text.
-
-Strategic Plan Text:
-{text}
-
-JSON OUTPUT:"""
-
-        response = self.llm.invoke(prompt)
-        content = response.content.strip()
-
-        log_llm_call(caller="StructuredExtractor.extract_strategic_plan", prompt=prompt, response=content, layer=1)
-
-        # Try to parse JSON, handling code blocks
-        if content.startswith("```"):
-            # Extract JSON from code block
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json or (not line.strip().startswith("```")):
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
-        try:
-            objectives = json.loads(content)
-            return objectives if isinstance(objectives, list) else [objectives]
-        except json.JSONDecodeError as e:
-            log_llm_call(caller="StructuredExtractor.extract_strategic_plan", prompt=prompt, response=content, error=str(e), layer=1)
-            print(f"Failed to parse LLM output as JSON: {e}")
-            print(f"Output was: {content[:500]}")
-            return []
+        prompt, messages = self._request(_STRATEGIC_INSTRUCTIONS, "Strategic Plan Text", text)
+        response = self.structured_strategic_llm.invoke(messages)
+        return self._parse_extraction(_STRATEGIC_CALLER, prompt, response, "goals")
 
     def extract_action_plan(self, text: str) -> list[dict[str, Any]]:
         """Extract action task groups from action plan text.
 
+        All action documents go in one call: pass the joined text from
+        DocumentIngestion.extract_from_separate_pdfs rather than calling
+        this once per document.
+
         Args:
             text: Action plan text
 
         Returns:
             List of task group dictionaries
         """
-        prompt = f"""Extract structured data from the following action plan document.
+        prompt, messages = self._request(_ACTION_INSTRUCTIONS, "Action Plan Text", text)
+        response = self.structured_action_llm.invoke(messages)
+        return self._parse_extraction(_ACTION_CALLER, prompt, response, "task_groups")
 
-For each task group, extract:
-- task_group_id: A short alphanumeric identifier (MUST follow format "A1_1", "A2_1", "A1_2", etc.)
-- task_group_name: Short name of the task group
-- phase: Which phase this belongs to (e.g., "Phase 1: Core Development")
-- resource_allocation: One of: heavy, moderate, light, minimal
-- allocation_reasoning: 1-2 sentence explanation for the allocation classification
-- tasks: List of ALL individual tasks (extract every task mentioned, do not summarize or group) with:
-  - name: Short name of the task
-  - description: Detailed description of what the task involves and its expected deliverables
-  - assignee: Person or team (string or null)
-  - deadline: Deadline as string
-  - status: One of: pending, in_progress, completed
-  - measurable_outcome: What defines success
-  - has_business_justification: boolean
-- intended_strategic_purpose: Brief description of which strategic goal this serves
-
-Return ONLY valid JSON array of task groups, no other text.
-
-Action Plan Text:
-{text}
-
-JSON OUTPUT:"""
-
-        response = self.llm.invoke(prompt)
-        content = response.content.strip()
-
-        log_llm_call(caller="StructuredExtractor.extract_action_plan", prompt=prompt, response=content, layer=1)
-
-        # Try to parse JSON, handling code blocks
-        if content.startswith("```"):
-            lines = content.split("\n")
-            json_lines = []
-            in_json = False
-            for line in lines:
-                if line.strip().startswith("```"):
-                    in_json = not in_json
-                    continue
-                if in_json or (not line.strip().startswith("```")):
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
-        try:
-            task_groups = json.loads(content)
-            return task_groups if isinstance(task_groups, list) else [task_groups]
-        except json.JSONDecodeError as e:
-            log_llm_call(caller="StructuredExtractor.extract_action_plan", prompt=prompt, response=content, error=str(e), layer=1)
-            print(f"Failed to parse LLM output as JSON: {e}")
-            print(f"Output was: {content[:500]}")
-            return []
+    def extract_plans(
+        self, strategic_text: str, action_text: str
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Extract strategic goals and action task groups concurrently.
+
+        The two requests are independent, so they run in parallel and take
+        as long as the slower of the two.
+
+        Args:
+            strategic_text: Strategic plan text
+            action_text: Action plan text
+
+        Returns:
+            Tuple of (strategic goals, task groups), as from
+            extract_strategic_plan and extract_action_plan
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            strategic_future = executor.submit(self.extract_strategic_plan, strategic_text)
+            action_future = executor.submit(self.extract_action_plan, action_text)
+            return strategic_future.result(), action_future.result()
 
     def write_to_knowledge_graph(
         self,
@@ -166,111 +358,107 @@ JSON OUTPUT:"""
             strategic_goals: List of strategic goals from extract_strategic_plan
             task_groups: List of task groups from extract_action_plan
         """
-        # Create organization
-        kg.add_entity("Organization", "Organization", {"label": "Organization"})
-
-        # Create plan
-        plan_id = "StrategicPlan_2026"
-        kg.add_entity(plan_id, "Plan", {"label": "Strategic Plan"})
-        kg.add_relationship(plan_id, "belongsTo", "Organization")
-
-        # Add strategic goals (high-level)
-        for goal_data in strategic_goals:
-            goal_id = goal_data["goal_id"]
-
-            # Create goal entity
-            goal_props = {
-                "label": goal_data["goal_name"],  # RDF standard
-                "description": goal_data.get("description", ""),
-                "strategicImportance": goal_data.get("strategic_importance", "moderate"),
-                "importanceReasoning": goal_data.get("importance_reasoning", ""),
-                "timeline": goal_data.get("timeline", ""),
-            }
-            kg.add_entity(goal_id, "Goal", goal_props)
-            kg.add_relationship(plan_id, "hasGoal", goal_id)
-
-            # Map BSC perspective
-            bsc_mapping = {
-                "financial": "BSC_Financial",
-                "customer": "BSC_Customer",
-                "internal_process": "BSC_InternalProcess",
-                "learning_growth": "BSC_LearningGrowth",
-            }
-            bsc_perspective = goal_data.get("bsc_perspective", "internal_process")
-            if bsc_perspective in bsc_mapping:
-                kg.add_relationship(goal_id, "bscPerspective", bsc_mapping[bsc_perspective])
-
-            # Add objectives (specific, measurable targets under the goal)
-            for i, objective_data in enumerate(goal_data.get("objectives", [])):
-                objective_id = f"{goal_id}_O{i+1}"
-                obj_props = {
-                    "label": objective_data["name"],
-                    "description": objective_data.get("description", ""),
-                }
-                kg.add_entity(objective_id, "Objective", obj_props)
-                kg.add_relationship(goal_id, "hasObjective", objective_id)
-
-            # Add KPIs
-            for i, kpi_data in enumerate(goal_data.get("kpis", [])):
-                kpi_id = f"{goal_id}_KPI{i+1}"
-                kpi_props = {
-                    "label": kpi_data.get("name", ""),  # RDF standard
-                    "kpiType": kpi_data.get("type", "lagging"),
-                    "baselineExists": kpi_data.get("baseline_exists", False),
-                    "measurable": kpi_data.get("measurable", True),
+        # All triples go to the graph in one batch at the end
+        with kg.bulk_write():
+            # Create organization
+            kg.add_entity("Organization", "Organization", {"label": "Organization"})
+
+            # Create plan
+            plan_id = "StrategicPlan_2026"
+            kg.add_entity(plan_id, "Plan", {"label": "Strategic Plan"})
+            kg.add_relationship(plan_id, "belongsTo", "Organization")
+
+            # Add strategic goals (high-level)
+            for goal_data in strategic_goals:
+                goal_id = goal_data["goal_id"]
+
+                # Create goal entity
+                goal_props = {
+                    "label": goal_data["goal_name"],  # RDF standard
+                    "description": goal_data.get("description", ""),
+                    "strategicImportance": goal_data.get("strategic_importance", "moderate"),
+                    "importanceReasoning": goal_data.get("importance_reasoning", ""),
+                    "timeline": goal_data.get("timeline", ""),
                 }
-                if kpi_data.get("owner"):
-                    kpi_props["owner"] = kpi_data["owner"]
-
-                kg.add_entity(kpi_id, "KPI", kpi_props)
-                kg.add_relationship(goal_id, "hasKPI", kpi_id)
-
-        # Group task groups by phase
-        phases = {}
-        for tg_data in task_groups:
-            phase_name = tg_data.get("phase", "Phase 1")
-            if phase_name not in phases:
-                phases[phase_name] = []
-            phases[phase_name].append(tg_data)
-
-        # Add phases and task groups
-        for phase_idx, (phase_name, tg_list) in enumerate(phases.items(), 1):
-            phase_id = f"P{phase_idx}"
-            kg.add_entity(
-                phase_id,
-                "ActionPhase",
-                {"label": phase_name, "phaseOrder": phase_idx},  # RDF standard
-            )
-            kg.add_relationship(plan_id, "hasPhase", phase_id)
-
-            # Add task groups in this phase
-            for tg_data in tg_list:
-                tg_id = tg_data["task_group_id"]
-                print(f"[DEBUG] task_group_id from LLM: '{tg_id}'")
-                tg_props = {
-                    "label": tg_data["task_group_name"],  # RDF standard
-                    "resourceAllocation": tg_data.get("resource_allocation", "moderate"),
-                    "allocationReasoning": tg_data.get("allocation_reasoning", ""),
-                    "intendedPurpose": tg_data.get("intended_strategic_purpose", ""),
-                }
-                kg.add_entity(tg_id, "TaskGroup", tg_props)
-                kg.add_relationship(phase_id, "containsGroup", tg_id)
-
-                # Add individual tasks
-                for task_idx, task_data in enumerate(tg_data.get("tasks", []), 1):
-                    task_id = f"{tg_id}_T{task_idx}"
-                    task_props = {
-                        "label": task_data["name"],
-                        "description": task_data.get("description", ""),
-                        "deadline": task_data.get("deadline", ""),
-                        "status": task_data.get("status", "pending"),
-                        "measurableOutcome": task_data.get("measurable_outcome", ""),
-                        "hasBusinessJustification": task_data.get(
-                            "has_business_justification", True
-                        ),
+                kg.add_entity(goal_id, "Goal", goal_props)
+                kg.add_relationship(plan_id, "hasGoal", goal_id)
+
+                # Map BSC perspective
+                bsc_perspective = goal_data.get("bsc_perspective", "internal_process")
+                if bsc_perspective in _BSC_MAPPING:
+                    kg.add_relationship(goal_id, "bscPerspective", _BSC_MAPPING[bsc_perspective])
+
+                # Add objectives (specific, measurable targets under the goal)
+                for i, objective_data in enumerate(goal_data.get("objectives", [])):
+                    objective_id = f"{goal_id}_O{i+1}"
+                    obj_props = {
+                        "label": objective_data["name"],
+                        "description": objective_data.get("description", ""),
                     }
-                    if task_data.get("assignee"):
-                        task_props["assignee"] = task_data["assignee"]
-
-                    kg.add_entity(task_id, "Task", task_props)
-                    kg.add_relationship(tg_id, "hasTask", task_id)
+                    kg.add_entity(objective_id, "Objective", obj_props)
+                    kg.add_relationship(goal_id, "hasObjective", objective_id)
+
+                # Add KPIs
+                for i, kpi_data in enumerate(goal_data.get("kpis", [])):
+                    kpi_id = f"{goal_id}_KPI{i+1}"
+                    kpi_props = {
+                        "label": kpi_data.get("name", ""),  # RDF standard
+                        "kpiType": kpi_data.get("type", "lagging"),
+                        "baselineExists": kpi_data.get("baseline_exists", False),
+                        "measurable": kpi_data.get("measurable", True),
+                    }
+                    if kpi_data.get("owner"):
+                        kpi_props["owner"] = kpi_data["owner"]
+
+                    kg.add_entity(kpi_id, "KPI", kpi_props)
+                    kg.add_relationship(goal_id, "hasKPI", kpi_id)
+
+            # Group task groups by phase
+            phases = {}
+            for tg_data in task_groups:
+                phase_name = tg_data.get("phase", "Phase 1")
+                if phase_name not in phases:
+                    phases[phase_name] = []
+                phases[phase_name].append(tg_data)
+
+            # Add phases and task groups
+            for phase_idx, (phase_name, tg_list) in enumerate(phases.items(), 1):
+                phase_id = f"P{phase_idx}"
+                kg.add_entity(
+                    phase_id,
+                    "ActionPhase",
+                    {"label": phase_name, "phaseOrder": phase_idx},  # RDF standard
+                )
+                kg.add_relationship(plan_id, "hasPhase", phase_id)
+
+                # Add task groups in this phase
+                for tg_data in tg_list:
+                    tg_id = tg_data["task_group_id"]
+                    print(f"[DEBUG] task_group_id from LLM: '{tg_id}'")
+                    tg_props = {
+                        "label": tg_data["task_group_name"],  # RDF standard
+                        "resourceAllocation": tg_data.get("resource_allocation", "moderate"),
+                        "allocationReasoning": tg_data.get("allocation_reasoning", ""),
+                        "intendedPurpose": tg_data.get("intended_strategic_purpose", ""),
+                    }
+                    kg.add_entity(tg_id, "TaskGroup", tg_props)
+                    kg.add_relationship(phase_id, "containsGroup", tg_id)
+
+                    # Add individual tasks
+                    for task_idx, task_data in enumerate(tg_data.get("tasks", []), 1):
+                        task_id = f"{tg_id}_T{task_idx}"
+                        task_props = {
+                            "label": task_data["name"],
+                            "description": task_data.get("description", ""),
+                            "deadline": task_data.get("deadline", ""),
+                            "status": task_data.get("status", "pending"),
+                            "measurableOutcome": task_data.get("measurable_outcome", ""),
+                            "hasBusinessJustification": task_data.get(
+                                "has_business_justification", True
+                            ),
+                        }
+                        if task_data.get("assignee"):
+                            task_props["assignee"] = task_data["assignee"]
+
+                        kg.add_entity(task_id, "Task", task_props)
+                        kg.add_relationship(tg_id, "hasTask", task_id)
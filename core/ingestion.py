@@ -1,52 +1,215 @@
 """PDF document ingestion and section detection.
 
 Handles parsing PDF files for strategic and action plans (separate or combined).
+Text is extracted with PDFium by default; pdfplumber's layout-aware
+extraction is kept as a fallback backend for table-heavy documents.
 """
 
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import pdfplumber
+import pypdfium2 as pdfium
+
+from .llm_cache import cache_key, load_cached_result, store_cached_result
+
+PDF_BACKENDS = ("pdfium", "plumber")
+
+# Marker between action plan documents in extract_from_separate_pdfs output
+ACTION_DOCUMENT_SEPARATOR = "--- ACTION PLAN DOCUMENT SEPARATOR ---"
+DEFAULT_PDF_BACKEND = "pdfium"
+
+# (resolved path, mtime_ns, size) -> content digest, so an unchanged file
+# is hashed once per process
+_file_digests: dict[tuple[str, int, int], str] = {}
+
+# Below this many pages in total, starting worker processes costs more
+# than pdfplumber's per-page layout analysis saves
+PARALLEL_MIN_PAGES = 8
+
+# Keywords that typically indicate section transitions, matched against
+# lowercased text
+_STRATEGIC_KEYWORDS_RE = re.compile(r"strategic plan|strategy|vision|mission|objectives")
+_ACTION_KEYWORDS_RE = re.compile(
+    r"action plan|implementation|roadmap|timeline|tasks|deliverables"
+)
+
+
+def _pdfium_page_text(doc: pdfium.PdfDocument, index: int) -> str:
+    """Plain text of one page, with pdfplumber-style line breaks and hyphens."""
+    page = doc[index]
+    textpage = page.get_textpage()
+    try:
+        text = textpage.get_text_bounded()
+    finally:
+        textpage.close()
+        page.close()
+    # PDFium ends lines with CRLF and marks end-of-line hyphens as \x02
+    return text.replace("\r\n", "\n").replace("\x02", "-").strip()
+
+
+def _page_count(pdf_path: Path, backend: str) -> int:
+    """Number of pages in a PDF."""
+    if backend == "pdfium":
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_page_range(
+    pdf_path: str, start: int | None, end: int | None, backend: str = DEFAULT_PDF_BACKEND
+) -> list[str]:
+    """Extract the text of pages [start:end] (slice semantics) of one PDF.
+
+    Module-level so it can run in a worker process; each worker opens the
+    PDF itself.
+    """
+    if backend == "pdfium":
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            return [_pdfium_page_text(doc, i) for i in range(len(doc))[start:end]]
+        finally:
+            doc.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:end]]
+
+
+def _file_digest(pdf_path: Path) -> str:
+    """Content hash of a file, reused while its mtime and size are unchanged."""
+    stat = pdf_path.stat()
+    memo_key = (str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    digest = _file_digests.get(memo_key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(pdf_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(block)
+        digest = _file_digests[memo_key] = hasher.hexdigest()
+    return digest
+
+
+def _extract_pages(pdf_paths: list[Path], backend: str) -> list[list[str]]:
+    """Extract per-page text of several PDFs, in page order.
+
+    Results are memoized in the result cache by file content and backend,
+    so an unchanged PDF is read from one JSON file instead of re-parsed.
+
+    Args:
+        pdf_paths: PDFs to extract (must exist)
+        backend: One of PDF_BACKENDS
+
+    Returns:
+        One list of page texts per PDF ("" for pages without text)
+    """
+    keys = [cache_key(_file_digest(pdf_path), backend) for pdf_path in pdf_paths]
+    pages: list[list[str] | None] = [load_cached_result("pdf_text", key) for key in keys]
+
+    missing = [i for i, cached in enumerate(pages) if cached is None]
+    if missing:
+        extracted = _extract_uncached([pdf_paths[i] for i in missing], backend)
+        for i, doc_pages in zip(missing, extracted):
+            pages[i] = doc_pages
+            store_cached_result("pdf_text", keys[i], doc_pages)
+    return pages
+
+
+def _extract_uncached(pdf_paths: list[Path], backend: str) -> list[list[str]]:
+    """Extract per-page text of several PDFs, in page order.
+
+    PDFium extracts natively and runs in-process. pdfplumber's layout
+    analysis is pure Python, so large inputs on that backend are split into
+    page ranges (across all documents) and extracted in a process pool.
+
+    Args:
+        pdf_paths: PDFs to extract (must exist)
+        backend: One of PDF_BACKENDS
+
+    Returns:
+        One list of page texts per PDF ("" for pages without text)
+    """
+    page_counts = [_page_count(pdf_path, backend) for pdf_path in pdf_paths]
+
+    workers = os.cpu_count() or 1
+    total_pages = sum(page_counts)
+    if backend == "pdfium" or workers == 1 or total_pages < PARALLEL_MIN_PAGES:
+        return [
+            _extract_page_range(str(path), 0, n, backend)
+            for path, n in zip(pdf_paths, page_counts)
+        ]
+
+    # About one range per worker; ranges never span two documents
+    chunk = -(-total_pages // workers)
+    jobs = [
+        (doc, start, min(start + chunk, n))
+        for doc, n in enumerate(page_counts)
+        for start in range(0, n, chunk)
+    ]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        results = executor.map(
+            _extract_page_range,
+            [str(pdf_paths[doc]) for doc, _, _ in jobs],
+            [start for _, start, _ in jobs],
+            [end for _, _, end in jobs],
+            [backend] * len(jobs),
+        )
+        pages: list[list[str]] = [[] for _ in pdf_paths]
+        for (doc, _, _), texts in zip(jobs, results):
+            pages[doc].extend(texts)
+    return pages
+
+
+def _check_backend(backend: str) -> None:
+    """Reject unknown extraction backends."""
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unsupported PDF backend: {backend}")
 
 
 class DocumentIngestion:
     """Parses PDF documents and extracts text."""
 
     @staticmethod
-    def extract_text_from_pdf(pdf_path: str | Path) -> str:
+    def extract_text_from_pdf(pdf_path: str | Path, backend: str = DEFAULT_PDF_BACKEND) -> str:
         """Extract all text from a single PDF file.
 
         Args:
             pdf_path: Path to the PDF file to parse
+            backend: "pdfium" (fast plain text) or "plumber" (layout-aware,
+                better on table-heavy PDFs)
 
         Returns:
             Complete text content of the PDF
 
         Raises:
             FileNotFoundError: If PDF file does not exist
+            ValueError: If the backend is unknown
         """
+        _check_backend(backend)
         pdf_path = Path(pdf_path)
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        with pdfplumber.open(pdf_path) as pdf:
-            text_parts = []
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-            return "\n\n".join(text_parts)
+        return "\n\n".join(text for text in _extract_pages([pdf_path], backend)[0] if text)
 
     @staticmethod
     def extract_from_separate_pdfs(
         strategic_pdf: str | Path,
         action_pdfs: list[str | Path],
+        backend: str = DEFAULT_PDF_BACKEND,
     ) -> tuple[str, str]:
         """Extract text from separate strategic and action plan PDFs.
 
         Args:
             strategic_pdf: Path to strategic plan PDF
             action_pdfs: List of paths to action plan PDFs
+            backend: Extraction backend, as for extract_text_from_pdf
 
         Returns:
             Tuple of (strategic_text, action_text)
@@ -54,16 +217,20 @@ class DocumentIngestion:
         This is the recommended method when you have separate PDFs for
         strategic plans and action plans.
         """
-        # Extract strategic plan text
-        strategic_text = DocumentIngestion.extract_text_from_pdf(strategic_pdf)
-
-        # Extract and combine all action plan texts
-        action_texts = []
-        for action_pdf in action_pdfs:
-            action_text = DocumentIngestion.extract_text_from_pdf(action_pdf)
-            action_texts.append(action_text)
+        _check_backend(backend)
+        pdf_paths = [Path(p) for p in (strategic_pdf, *action_pdfs)]
+        for pdf_path in pdf_paths:
+            if not pdf_path.exists():
+                raise FileNotFoundError(f"PDF not found: {pdf_path}")
+
+        # All documents share one worker pool
+        texts = [
+            "\n\n".join(text for text in pages if text)
+            for pages in _extract_pages(pdf_paths, backend)
+        ]
+        strategic_text, action_texts = texts[0], texts[1:]
 
-        action_text = "\n\n--- ACTION PLAN DOCUMENT SEPARATOR ---\n\n".join(action_texts)
+        action_text = f"\n\n{ACTION_DOCUMENT_SEPARATOR}\n\n".join(action_texts)
 
         return strategic_text, action_text
 
@@ -74,6 +241,7 @@ class DocumentIngestion:
         strategic_end: Optional[int] = None,
         action_start: Optional[int] = None,
         action_end: Optional[int] = None,
+        backend: str = DEFAULT_PDF_BACKEND,
     ) -> tuple[str, str]:
         """Extract strategic and action sections from a combined PDF.
 
@@ -83,6 +251,7 @@ class DocumentIngestion:
             strategic_end: Ending page for strategic plan (1-indexed)
             action_start: Starting page for action plan (1-indexed)
             action_end: Ending page for action plan (1-indexed)
+            backend: Extraction backend, as for extract_text_from_pdf
 
         Returns:
             Tuple of (strategic_text, action_text)
@@ -94,36 +263,30 @@ class DocumentIngestion:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-
-            # Extract strategic plan section
-            if strategic_start and strategic_end:
-                strategic_pages = pdf.pages[strategic_start - 1 : strategic_end]
-            elif strategic_start:
-                strategic_pages = pdf.pages[
-                    strategic_start - 1 : total_pages // 2
-                ]
-            else:
-                strategic_pages = pdf.pages[: total_pages // 2]
-
-            strategic_text = "\n\n".join(
-                [p.extract_text() or "" for p in strategic_pages]
-            )
-
-            # Extract action plan section
-            if action_start and action_end:
-                action_pages = pdf.pages[action_start - 1 : action_end]
-            elif action_start:
-                action_pages = pdf.pages[action_start - 1 :]
-            else:
-                action_pages = pdf.pages[total_pages // 2 :]
-
-            action_text = "\n\n".join(
-                [p.extract_text() or "" for p in action_pages]
-            )
-
-            return strategic_text, action_text
+        _check_backend(backend)
+        pages = _extract_pages([pdf_path], backend)[0]
+        total_pages = len(pages)
+
+        # Strategic plan section (page slice bounds)
+        if strategic_start and strategic_end:
+            strategic_range = (strategic_start - 1, strategic_end)
+        elif strategic_start:
+            strategic_range = (strategic_start - 1, total_pages // 2)
+        else:
+            strategic_range = (None, total_pages // 2)
+
+        # Action plan section
+        if action_start and action_end:
+            action_range = (action_start - 1, action_end)
+        elif action_start:
+            action_range = (action_start - 1, None)
+        else:
+            action_range = (total_pages // 2, None)
+
+        strategic_text = "\n\n".join(pages[slice(*strategic_range)])
+        action_text = "\n\n".join(pages[slice(*action_range)])
+
+        return strategic_text, action_text
 
     def detect_section_boundaries(self, text: str) -> dict[str, int]:
         """Attempt to detect strategic vs action plan boundaries using keywords.
@@ -134,37 +297,18 @@ class DocumentIngestion:
         Returns:
             Dictionary with detected boundary positions
         """
-        lines = text.split("\n")
         boundaries = {}
 
-        # Keywords that typically indicate section transitions
-        strategic_keywords = [
-            "strategic plan",
-            "strategy",
-            "vision",
-            "mission",
-            "objectives",
-        ]
-        action_keywords = [
-            "action plan",
-            "implementation",
-            "roadmap",
-            "timeline",
-            "tasks",
-            "deliverables",
-        ]
-
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-
-            # Check for strategic section start
-            if not boundaries.get("strategic_start"):
-                if any(kw in line_lower for kw in strategic_keywords):
-                    boundaries["strategic_start"] = i
-
-            # Check for action section start
-            if not boundaries.get("action_start"):
-                if any(kw in line_lower for kw in action_keywords):
-                    boundaries["action_start"] = i
+        # Lowercase once for the whole text (IGNORECASE matching is several
+        # times slower), then one scan per section; the match offset is
+        # turned into a line index
+        text_lower = text.lower()
+        for name, pattern in (
+            ("strategic_start", _STRATEGIC_KEYWORDS_RE),
+            ("action_start", _ACTION_KEYWORDS_RE),
+        ):
+            match = pattern.search(text_lower)
+            if match:
+                boundaries[name] = text_lower.count("\n", 0, match.start())
 
         return boundaries
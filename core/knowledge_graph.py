@@ -1,13 +1,102 @@
 """Knowledge Graph — Central data store using RDFLib.
 
-All layers write to and read from this central KG.
+All layers write to and read from this central KG. Queries built with
+prepare_query run on Oxigraph when pyoxigraph is installed, otherwise on
+rdflib.
 """
 
-from typing import Any, Optional
+import hashlib
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator, Optional
 
 import networkx as nx
-from rdflib import Graph, Literal, Namespace, RDF, RDFS, URIRef
+from rdflib import BNode, Graph, Literal, Namespace, RDF, RDFS, URIRef
 from rdflib.namespace import XSD
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+
+try:
+    import pyoxigraph
+except ImportError:  # optional native SPARQL engine; rdflib is the fallback
+    pyoxigraph = None
+
+_LANG_STRING = "http://www.w3.org/1999/02/22-rdf-syntax-ns#langString"
+
+# Literal datatype per exact property value type; matching on type() keeps
+# bool apart from int. Strings and subclasses go through isinstance checks.
+_LITERAL_DATATYPES = {bool: XSD.boolean, int: XSD.integer, float: XSD.float}
+
+
+@lru_cache(maxsize=65536)
+def local_name(uri: Any) -> str:
+    """Return the local part of a BITA URI (the text after '#').
+
+    Memoized: the same handful of URIs are resolved over and over while
+    walking query results.
+
+    Args:
+        uri: URIRef, Literal or string
+
+    Returns:
+        Entity/property identifier, e.g. "G1_O2" for bita:G1_O2
+    """
+    return str(uri).rpartition("#")[2]
+
+
+def prepare_query(text: str) -> Query:
+    """Parse a SPARQL query once, for reuse across query_sparql calls.
+
+    The source text is kept on the parsed query so it can still be run on
+    Oxigraph, which takes query strings.
+
+    Args:
+        text: SPARQL query string
+
+    Returns:
+        rdflib prepared query
+    """
+    query = prepareQuery(text)
+    query.sparql_text = text
+    return query
+
+
+@lru_cache(maxsize=128)
+def _parse_query(text: str, namespaces: tuple[tuple[str, URIRef], ...]) -> Query:
+    """Parse a query string for rdflib, memoized by text and bound prefixes.
+
+    Lets repeated string queries on the rdflib path skip re-parsing.
+    """
+    return prepareQuery(text, initNs=dict(namespaces))
+
+
+@lru_cache(maxsize=65536)
+def _to_oxigraph(term: Any) -> Any:
+    """Convert an rdflib term to the equivalent pyoxigraph term.
+
+    Memoized like local_name: writes reuse the same URIs over and over.
+    """
+    if isinstance(term, URIRef):
+        return pyoxigraph.NamedNode(term)
+    if isinstance(term, Literal):
+        if term.language:
+            return pyoxigraph.Literal(term, language=term.language)
+        if term.datatype is not None:
+            return pyoxigraph.Literal(term, datatype=pyoxigraph.NamedNode(term.datatype))
+        return pyoxigraph.Literal(term)
+    return pyoxigraph.BlankNode(term)
+
+
+def _from_oxigraph(term: Any) -> Any:
+    """Convert a pyoxigraph term to the equivalent rdflib term."""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.Literal):
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        datatype = term.datatype.value
+        return Literal(term.value, datatype=None if datatype == _LANG_STRING else URIRef(datatype))
+    return BNode(term.value)
 
 
 class KnowledgeGraph:
@@ -15,11 +104,33 @@ class KnowledgeGraph:
 
     def __init__(self):
         """Initialize empty RDF graph with BITA namespace."""
-        self.graph = Graph()
+        # rdflib's indexed Memory store, named explicitly. Prepared SPARQL
+        # queries run on an Oxigraph mirror instead (see query_sparql).
+        self.graph = Graph(store="Memory")
         self.bita = Namespace("http://bita-system.org/ontology#")
         self.graph.bind("bita", self.bita)
         self.graph.bind("xsd", XSD)
 
+        # Number of writes made through this class; fingerprint() and the
+        # caches below are keyed on it
+        self._mutations = 0
+        # Memoized get_entity_properties results, valid while _mutations is
+        # unchanged
+        self._properties_cache: dict[str, dict[str, Any]] = {}
+        self._properties_cache_mutations = -1
+        # (fingerprint, digest) of the last content_hash() computation
+        self._content_hash: tuple[tuple[int, int], str] | None = None
+        # Oxigraph mirror of self.graph. _write and bulk_write add to it
+        # directly; load and parse leave it stale, and the next prepared
+        # query reloads it
+        self._oxigraph_store = None
+        self._oxigraph_fingerprint: tuple[int, int] | None = None
+        # Triples staged by add_entity / add_relationship inside bulk_write()
+        self._pending_triples: list[tuple] | None = None
+        # bita URIs of type and predicate names; the vocabulary is small and
+        # Namespace indexing builds a new URIRef on every call
+        self._vocab_terms: dict[str, URIRef] = {}
+
         # Initialize static instances (BSC perspectives)
         self._init_static_instances()
 
@@ -72,40 +183,51 @@ class KnowledgeGraph:
             URIRef of the created entity
         """
         uri = self.bita[entity_id]
-        self.graph.add((uri, RDF.type, self.bita[entity_type]))
+        term = self._vocab_term
+        triples = [(uri, RDF.type, term(entity_type))]
 
         # Add rdfs:label if provided (RDF standard for display name)
         if "label" in properties:
-            label_value = properties["label"]
-            self.graph.add((uri, RDFS.label, Literal(label_value)))
+            triples.append((uri, RDFS.label, Literal(properties["label"])))
 
         # Add all other properties (excluding "label" which is handled above)
-        for prop, value in properties.items():
-            if prop == "label":
-                continue  # Already added as rdfs:label
-
-            predicate = self.bita[prop]
-
-            # Handle different value types
-            if isinstance(value, bool):
-                obj = Literal(value, datatype=XSD.boolean)
-            elif isinstance(value, int):
-                obj = Literal(value, datatype=XSD.integer)
-            elif isinstance(value, float):
-                obj = Literal(value, datatype=XSD.float)
-            elif isinstance(value, str):
-                # Check if it's a reference to another entity (short ID like G1, A1_2, BSC_Financial)
-                if value and value[0].isupper() and "_" in value and " " not in value and len(value) <= 30:
-                    obj = self.bita[value]
-                else:
-                    obj = Literal(value, datatype=XSD.string)
-            else:
-                obj = Literal(str(value), datatype=XSD.string)
-
-            self.graph.add((uri, predicate, obj))
+        triples.extend(
+            (uri, term(prop), self._property_object(value))
+            for prop, value in properties.items()
+            if prop != "label"
+        )
 
+        self._write(triples)
         return uri
 
+    def _vocab_term(self, name: str) -> URIRef:
+        """bita URI of a class or property name, memoized per graph."""
+        term = self._vocab_terms.get(name)
+        if term is None:
+            term = self._vocab_terms[name] = self.bita[name]
+        return term
+
+    def _property_object(self, value: Any) -> URIRef | Literal:
+        """RDF object for a property value passed to add_entity."""
+        datatype = _LITERAL_DATATYPES.get(type(value))
+        if datatype is not None:
+            return Literal(value, datatype=datatype)
+
+        # Handle different value types
+        if isinstance(value, str):
+            # Check if it's a reference to another entity (short ID like G1, A1_2, BSC_Financial);
+            # the length test comes first so long descriptions skip the scans
+            if 0 < len(value) <= 30 and value[0].isupper() and "_" in value and " " not in value:
+                return self.bita[value]
+            return Literal(value, datatype=XSD.string)
+        if isinstance(value, bool):
+            return Literal(value, datatype=XSD.boolean)
+        if isinstance(value, int):
+            return Literal(value, datatype=XSD.integer)
+        if isinstance(value, float):
+            return Literal(value, datatype=XSD.float)
+        return Literal(str(value), datatype=XSD.string)
+
     def add_relationship(
         self, subject_id: str, predicate: str, object_id: str
     ) -> None:
@@ -116,24 +238,162 @@ class KnowledgeGraph:
             predicate: Relationship type
             object_id: ID of the object entity
         """
-        subject = self.bita[subject_id]
-        predicate_uri = self.bita[predicate]
-        obj = self.bita[object_id]
+        self._write(
+            [(self.bita[subject_id], self._vocab_term(predicate), self.bita[object_id])]
+        )
+
+    def add_triples(self, triples: list[tuple]) -> None:
+        """Add raw (subject, predicate, object) triples to the graph.
+
+        Layers that write properties add_entity cannot express go through
+        here rather than self.graph, so cached derived values see the write.
+
+        Args:
+            triples: rdflib term triples
+        """
+        self._write(triples)
+
+    def _write(self, triples: list[tuple]) -> None:
+        """Add triples now, or stage them while a bulk_write() is open."""
+        if self._pending_triples is not None:
+            self._pending_triples.extend(triples)
+        else:
+            self._add_now(triples)
+
+    def _add_now(self, triples: list[tuple]) -> None:
+        """Add triples to the graph and, if it is current, the Oxigraph mirror."""
+        mirror_current = (
+            self._oxigraph_store is not None
+            and self._oxigraph_fingerprint == self.fingerprint()
+        )
+        self.graph.addN((s, p, o, self.graph) for s, p, o in triples)
+        self._mutations += 1
+        if mirror_current:
+            self._oxigraph_store.extend(
+                pyoxigraph.Quad(_to_oxigraph(s), _to_oxigraph(p), _to_oxigraph(o))
+                for s, p, o in triples
+            )
+            self._oxigraph_fingerprint = self.fingerprint()
 
-        self.graph.add((subject, predicate_uri, obj))
+    @contextmanager
+    def bulk_write(self) -> Iterator[None]:
+        """Stage add_entity / add_relationship triples and add them at once.
 
-    def query_sparql(self, query: str) -> list[dict]:
+        Everything written inside the block goes to the graph in a single
+        addN on exit. Queries inside the block do not see staged triples.
+        Nested blocks join the outermost one.
+        """
+        if self._pending_triples is not None:
+            yield
+            return
+        self._pending_triples = []
+        try:
+            yield
+        finally:
+            pending, self._pending_triples = self._pending_triples, None
+            if pending:
+                self._add_now(pending)
+
+    def query_sparql(
+        self, query: str | Query, init_bindings: dict[str, Any] | None = None
+    ) -> list[dict]:
         """Execute a SPARQL query.
 
+        Queries built with prepare_query run on Oxigraph when pyoxigraph is
+        installed and no bindings are given. Everything else runs on
+        rdflib, with query strings parsed once against the graph's bound
+        prefixes and reused. Oxigraph returns plain literals typed as
+        xsd:string, so callers of prepared queries compare literal values,
+        not terms.
+
         Args:
-            query: SPARQL query string
+            query: SPARQL query string, or a query parsed once with
+                prepare_query (or rdflib.plugins.sparql.prepareQuery)
+            init_bindings: Optional initial variable bindings (e.g.
+                {"goal": kg.bita["G1"]}) for parameterized queries
 
         Returns:
             List of result bindings as dictionaries
         """
-        results = self.graph.query(query)
+        # Only prepared queries: they declare their own prefixes, which a
+        # query string may instead take from the graph's bindings
+        text = getattr(query, "sparql_text", None)
+        if pyoxigraph is not None and text is not None and not init_bindings:
+            solutions = self._get_oxigraph_store().query(text)
+            if isinstance(solutions, pyoxigraph.QuerySolutions):
+                names = [v.value for v in solutions.variables]
+                return [
+                    {name: _from_oxigraph(term) for name, term in zip(names, solution) if term is not None}
+                    for solution in solutions
+                ]
+
+        if isinstance(query, str):
+            # Resolved against the graph's prefixes, as graph.query(str) does
+            query = _parse_query(query, tuple(self.graph.namespaces()))
+        results = self.graph.query(query, initBindings=init_bindings)
         return [dict(row.asdict()) for row in results]
 
+    def _get_oxigraph_store(self):
+        """Return an Oxigraph store holding the current triples.
+
+        The store is bulk-loaded from an N-Triples dump, then kept current
+        by _write and bulk_write. Only a write they did not make (load,
+        parse) triggers another full load.
+        """
+        fingerprint = self.fingerprint()
+        if self._oxigraph_store is None or self._oxigraph_fingerprint != fingerprint:
+            store = pyoxigraph.Store()
+            store.bulk_load(
+                input=self.graph.serialize(format="nt", encoding="utf-8"),
+                format=pyoxigraph.RdfFormat.N_TRIPLES,
+            )
+            self._oxigraph_store = store
+            self._oxigraph_fingerprint = fingerprint
+        return self._oxigraph_store
+
+    def subjects_of_type(self, entity_type: str) -> list[str]:
+        """List the IDs of all entities of a given type.
+
+        A direct rdf:type index probe, much cheaper than running the
+        equivalent single-pattern SPARQL SELECT.
+
+        Args:
+            entity_type: Type/class name (e.g., "Goal", "TaskGroup")
+
+        Returns:
+            Entity identifiers (local names)
+        """
+        return [local_name(s) for s in self.graph.subjects(RDF.type, self.bita[entity_type])]
+
+    def fingerprint(self) -> tuple[int, int]:
+        """Cheap identifier for the graph's current state.
+
+        Changes on every write made through this class (add_entity,
+        add_relationship, add_triples, bulk_write, load, parse). Writes made
+        directly on self.graph are not seen. Used to key caches of values
+        derived from the graph.
+
+        Returns:
+            Tuple of (id of the rdflib graph, number of writes so far)
+        """
+        return id(self.graph), self._mutations
+
+    def content_hash(self) -> str:
+        """Stable digest of the graph's triples, identical across runs.
+
+        Unlike fingerprint() this survives process restarts, so it can key
+        on-disk caches. Recomputed only when the fingerprint changes.
+
+        Returns:
+            Hex digest of the sorted N-Triples terms
+        """
+        fingerprint = self.fingerprint()
+        if self._content_hash is None or self._content_hash[0] != fingerprint:
+            lines = sorted(f"{s.n3()} {p.n3()} {o.n3()}" for s, p, o in self.graph)
+            digest = hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=16).hexdigest()
+            self._content_hash = (fingerprint, digest)
+        return self._content_hash[1]
+
     def get_entity_properties(self, entity_id: str) -> dict[str, Any]:
         """Get all properties of an entity.
 
@@ -141,8 +401,16 @@ class KnowledgeGraph:
             entity_id: Entity identifier
 
         Returns:
-            Dictionary of property names to values
+            Dictionary of property names to values (a fresh copy; results
+            are cached until the next write to the graph)
         """
+        if self._mutations != self._properties_cache_mutations:
+            self._properties_cache.clear()
+            self._properties_cache_mutations = self._mutations
+        cached = self._properties_cache.get(entity_id)
+        if cached is not None:
+            return dict(cached)
+
         uri = self.bita[entity_id]
         properties = {}
 
@@ -152,16 +420,17 @@ class KnowledgeGraph:
                 continue
 
             # Extract property name from URI
-            prop_name = str(pred).split("#")[-1]
+            prop_name = local_name(pred)
 
             # Extract value
             if isinstance(obj, Literal):
                 properties[prop_name] = obj.toPython()
             else:
                 # It's a reference to another entity
-                properties[prop_name] = str(obj).split("#")[-1]
+                properties[prop_name] = local_name(obj)
 
-        return properties
+        self._properties_cache[entity_id] = properties
+        return dict(properties)
 
     def export_to_networkx(self) -> nx.DiGraph:
         """Export the RDF graph to NetworkX for graph analysis.
@@ -169,28 +438,23 @@ class KnowledgeGraph:
         Returns:
             NetworkX directed graph
         """
-        G = nx.DiGraph()
-
-        # Add nodes
-        for subj in self.graph.subjects(unique=True):
-            node_id = str(subj).split("#")[-1]
-            # Get node type
-            for obj in self.graph.objects(subj, RDF.type):
-                node_type = str(obj).split("#")[-1]
-                G.add_node(node_id, type=node_type)
-                break
-
-        # Add edges
+        # One pass over the triples: the first rdf:type of each subject
+        # names its node type, URI-valued properties become edges
+        node_types: dict[str, str] = {}
+        edges: list[tuple[str, str, str]] = []
         for subj, pred, obj in self.graph:
             if pred == RDF.type:
-                continue
-
-            subj_id = str(subj).split("#")[-1]
-            pred_name = str(pred).split("#")[-1]
+                node_types.setdefault(local_name(subj), local_name(obj))
+            elif isinstance(obj, URIRef):
+                edges.append((local_name(subj), local_name(obj), local_name(pred)))
 
-            if isinstance(obj, URIRef):
-                obj_id = str(obj).split("#")[-1]
-                G.add_edge(subj_id, obj_id, relationship=pred_name)
+        G = nx.DiGraph()
+        G.add_nodes_from(
+            (node_id, {"type": node_type}) for node_id, node_type in node_types.items()
+        )
+        G.add_edges_from(
+            (subj_id, obj_id, {"relationship": rel}) for subj_id, obj_id, rel in edges
+        )
 
         return G
 
@@ -205,14 +469,20 @@ class KnowledgeGraph:
         """
         return self.graph.serialize(format=format)
 
-    def save(self, filepath: str, format: str = "turtle"):
+    def save(self, filepath: str, format: str = "turtle", streaming: bool = False):
         """Save the graph to a file.
 
         Args:
             filepath: Path to output file
             format: Serialization format
+            streaming: Write N-Triples straight to the file one triple at a
+                time (overrides format). Turtle and the other pretty formats
+                first group and sort the whole graph in memory.
         """
-        self.graph.serialize(destination=filepath, format=format)
+        if streaming:
+            self.graph.serialize(destination=filepath, format="nt", encoding="utf-8")
+        else:
+            self.graph.serialize(destination=filepath, format=format)
 
     def load(self, filepath: str, format: str = "turtle"):
         """Load a graph from a file.
@@ -222,3 +492,14 @@ class KnowledgeGraph:
             format: Serialization format
         """
         self.graph.parse(filepath, format=format)
+        self._mutations += 1
+
+    def parse(self, data: str, format: str = "turtle"):
+        """Add the triples of a serialized graph held in a string.
+
+        Args:
+            data: Serialized RDF
+            format: Serialization format
+        """
+        self.graph.parse(data=data, format=format)
+        self._mutations += 1
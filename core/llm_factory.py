@@ -3,7 +3,10 @@
 Supports Anthropic (Claude) and OpenAI providers via LangChain.
 """
 
-from typing import Any
+import hashlib
+import importlib
+from functools import lru_cache
+from typing import Any, Callable
 
 # Provider → model options mapping
 LLM_PROVIDERS = {
@@ -14,6 +17,7 @@ LLM_PROVIDERS = {
             "claude-opus-4-6",
         ],
         "default_model": "claude-sonnet-4-5-20250929",
+        "small_model": "claude-haiku-4-5-20251001",
         "key_placeholder": "sk-ant-...",
         "key_label": "Anthropic API Key",
     },
@@ -24,6 +28,7 @@ LLM_PROVIDERS = {
             "gpt-4-turbo",
         ],
         "default_model": "gpt-4o",
+        "small_model": "gpt-4o-mini",
         "key_placeholder": "sk-...",
         "key_label": "OpenAI API Key",
     },
@@ -31,6 +36,68 @@ LLM_PROVIDERS = {
 
 DEFAULT_PROVIDER = "Anthropic"
 
+# Upper bound on concurrent requests per pipeline stage; keeps bursts under
+# typical per-key rate limits for both providers.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Provider → loader returning its chat model class. Provider packages are
+# imported on first use only, then the class is reused.
+_FACTORIES: dict[str, Callable[[], type]] = {}
+
+
+def _register(provider: str, import_path: str) -> None:
+    """Register a provider's chat model class by "module:ClassName" path."""
+    module_name, class_name = import_path.split(":")
+    resolved: list[type] = []
+
+    def load() -> type:
+        if not resolved:
+            resolved.append(getattr(importlib.import_module(module_name), class_name))
+        return resolved[0]
+
+    _FACTORIES[provider] = load
+
+
+_register("Anthropic", "langchain_anthropic:ChatAnthropic")
+_register("OpenAI", "langchain_openai:ChatOpenAI")
+
+class _ApiKey:
+    """API key that hashes and compares by digest, for use as a cache key.
+
+    The key lives in the _cached_llm entry of the model built with it (the
+    model holds the key anyway) and is dropped when that entry is evicted.
+    """
+
+    __slots__ = ("value", "digest")
+
+    def __init__(self, value: str):
+        self.value = value
+        self.digest = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ApiKey) and other.digest == self.digest
+
+    def __repr__(self) -> str:
+        return f"_ApiKey(<{self.digest[:8]}>)"
+
+
+@lru_cache(maxsize=16)
+def _cached_llm(provider: str, model: str, api_key: _ApiKey, temperature: float):
+    """Construct a chat model once per configuration and share it.
+
+    Building a model sets up its HTTP client; reusing the instance across
+    the pipeline layers and dashboard reruns also reuses its connection
+    pool. Chat models hold no per-call state, so sharing is safe.
+    """
+    return _FACTORIES[provider]()(
+        model=model,
+        api_key=api_key.value,
+        temperature=temperature,
+    )
+
 
 def create_llm(
     provider: str,
@@ -49,25 +116,51 @@ def create_llm(
         **kwargs: Additional keyword arguments passed to the model constructor
 
     Returns:
-        A LangChain BaseChatModel instance
+        A LangChain BaseChatModel instance, shared between calls with the
+        same provider, model, key and temperature (and no extra kwargs)
     """
-    if provider == "Anthropic":
-        from langchain_anthropic import ChatAnthropic
+    if provider not in _FACTORIES:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
 
-        return ChatAnthropic(
+    if kwargs:
+        # Arbitrary constructor options are not cached
+        return _FACTORIES[provider]()(
             model=model,
             api_key=api_key,
             temperature=temperature,
             **kwargs,
         )
-    elif provider == "OpenAI":
-        from langchain_openai import ChatOpenAI
 
-        return ChatOpenAI(
-            model=model,
-            api_key=api_key,
-            temperature=temperature,
-            **kwargs,
+    return _cached_llm(provider, model, _ApiKey(api_key), temperature)
+
+
+def build_cached_messages(provider: str, static_prefix: str, dynamic_content: str) -> list:
+    """Build chat messages that put a reusable prefix ahead of per-call content.
+
+    The static prefix goes in a system message so every call shares the same
+    leading tokens. Anthropic needs an explicit cache breakpoint on it; OpenAI
+    caches long shared prefixes automatically.
+
+    Args:
+        provider: "Anthropic" or "OpenAI"
+        static_prefix: Instructions identical across calls (rubric, schema)
+        dynamic_content: Per-call content appended after the prefix
+
+    Returns:
+        List of LangChain messages suitable for invoke() or batch()
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    if provider == "Anthropic":
+        system = SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": static_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         )
     else:
-        raise ValueError(f"Unsupported LLM provider: {provider}")
+        system = SystemMessage(content=static_prefix)
+    return [system, HumanMessage(content=dynamic_content)]
@@ -5,10 +5,130 @@ and cost data from all LLM calls so they can be inspected in the
 dashboard debug page.
 """
 
+import atexit
+import os
+import re
+import shutil
+import tempfile
+import threading
+import warnings
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
-_llm_logs: list[dict[str, Any]] = []
+import numpy as np
+
+# Log entry fields, in the order entries are reported
+_LOG_FIELDS = (
+    "call_id",
+    "timestamp",
+    "caller",
+    "prompt",
+    "response",
+    "parsed_result",
+    "error",
+    "layer",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "latency_ms",
+    "model",
+    "cached",
+    "prompt_truncated",
+    "response_truncated",
+)
+
+# Only the most recent calls are kept (override with this env var); the
+# running totals below still cover every call since the last clear
+LOG_MAX_ENV_VAR = "BITA_LLM_LOG_MAX"
+DEFAULT_LOG_MAX = 5000
+
+
+def _log_max_from_env() -> int:
+    """Read the log bound from the environment, falling back on bad values."""
+    raw = os.environ.get(LOG_MAX_ENV_VAR, "").strip()
+    if not raw:
+        return DEFAULT_LOG_MAX
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        warnings.warn(
+            f"{LOG_MAX_ENV_VAR}={raw!r} is not a positive integer; "
+            f"keeping the last {DEFAULT_LOG_MAX} calls",
+            stacklevel=2,
+        )
+        return DEFAULT_LOG_MAX
+    return value
+
+
+_max_rows = _log_max_from_env()
+
+# Column-oriented ring buffer: row i of every column is the i-th oldest
+# retained call. Text fields are bounded deques; integer fields live in
+# compact NumPy buffers (-1 where a value was not recorded) that grow by
+# doubling up to _max_rows, then wrap around from _start.
+_TEXT_FIELDS = ("timestamp", "caller", "prompt", "response", "parsed_result", "error")
+_INT_FIELDS = ("layer", "input_tokens", "output_tokens", "cache_read_tokens", "latency_ms")
+# Long texts are kept in memory as a head/tail preview; the full text goes
+# to a spool file read back by get_full_text
+_SPOOLED_FIELDS = ("prompt", "response")
+_SPOOL_THRESHOLD = 2048
+_PREVIEW_CHARS = 1024
+_MISSING = -1
+_INITIAL_CAPACITY = min(64, _max_rows)
+
+_log_columns: dict[str, deque] = {field: deque(maxlen=_max_rows) for field in _TEXT_FIELDS}
+_buffers: dict[str, np.ndarray] = {
+    **{field: np.empty(_INITIAL_CAPACITY, dtype=np.int64) for field in _INT_FIELDS},
+    # Index into _model_names, or -1 for no model
+    "model": np.empty(_INITIAL_CAPACITY, dtype=np.int64),
+    "cached": np.empty(_INITIAL_CAPACITY, dtype=bool),
+    "call_id": np.empty(_INITIAL_CAPACITY, dtype=np.int64),
+    **{f"{field}_truncated": np.empty(_INITIAL_CAPACITY, dtype=bool) for field in _SPOOLED_FIELDS},
+}
+# Buffer slot of the oldest retained call, and number of retained calls
+_start = 0
+_size = 0
+_next_call_id = 0
+# Created on first spooled text, removed by clear_llm_logs and at exit
+_spool_dir: Path | None = None
+# Distinct model names in first-seen order, name -> index, and each
+# model's cost table entry (resolved once, when the model is first seen)
+_model_names: list[str] = []
+_model_index: dict[str, int] = {}
+_model_costs: list[dict[str, float] | None] = []
+# Calls may be logged from worker threads; a row spans several columns
+_lock = threading.Lock()
+
+# Running aggregates, updated as each call is logged so get_llm_stats
+# never rescans the log
+_totals: dict[str, Any] = {}
+_per_layer: dict[int, dict[str, int]] = {}
+_per_model: dict[str, dict[str, int]] = {}
+
+
+def _reset_totals() -> None:
+    """Zero the running aggregates."""
+    _totals.update(
+        calls=0,
+        cached_calls=0,
+        input_tokens=0,
+        output_tokens=0,
+        latency_ms=0,
+        timed_calls=0,
+        timed_latency_ms=0,
+        estimated_cost=0.0,
+    )
+    _per_layer.clear()
+    _per_model.clear()
+
+
+_reset_totals()
 
 # Estimated cost per 1K tokens (USD) by model family
 _MODEL_COST_PER_1K: dict[str, dict[str, float]] = {
@@ -21,6 +141,12 @@ _MODEL_COST_PER_1K: dict[str, dict[str, float]] = {
     "gpt-4": {"input": 0.03, "output": 0.06},
 }
 
+# Cost table keys as one anchored alternation, longest first so e.g.
+# "gpt-4o-mini" is not priced as "gpt-4o"
+_COST_KEY_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(_MODEL_COST_PER_1K, key=len, reverse=True))
+)
+
 
 def log_llm_call(
     *,
@@ -32,6 +158,7 @@ def log_llm_call(
     layer: int | None = None,
     input_tokens: int | None = None,
     output_tokens: int | None = None,
+    cache_read_tokens: int | None = None,
     latency_ms: int | None = None,
     model: str | None = None,
     cached: bool = False,
@@ -47,36 +174,260 @@ def log_llm_call(
         layer: Pipeline layer number (1-4)
         input_tokens: Number of input/prompt tokens
         output_tokens: Number of output/completion tokens
+        cache_read_tokens: Input tokens served from the provider's prompt cache
         latency_ms: Call latency in milliseconds
         model: Model identifier (e.g. "gpt-4o")
         cached: Whether this response was served from cache
     """
-    _llm_logs.append(
-        {
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
-            "caller": caller,
-            "prompt": prompt,
-            "response": response,
-            "parsed_result": parsed_result,
-            "error": error,
-            "layer": layer,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "latency_ms": latency_ms,
-            "model": model,
-            "cached": cached,
+    global _start, _size, _next_call_id
+
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    with _lock:
+        capacity = len(_buffers["cached"])
+        if _size == capacity and capacity < _max_rows:
+            # Not wrapped yet (_start is 0), so resizing keeps row order
+            capacity = min(2 * capacity, _max_rows)
+            for name, buffer in _buffers.items():
+                _buffers[name] = np.resize(buffer, capacity)
+        if _size == capacity:
+            # Full: overwrite the oldest call (the deques drop it too)
+            slot = _start
+            _start = (_start + 1) % capacity
+            _drop_spooled(slot)
+        else:
+            slot = (_start + _size) % capacity
+            _size += 1
+
+        call_id = _next_call_id
+        _next_call_id += 1
+        _buffers["call_id"][slot] = call_id
+        texts = {"prompt": prompt, "response": response}
+        for field in _SPOOLED_FIELDS:
+            text = texts[field]
+            truncated = text is not None and len(text) > _SPOOL_THRESHOLD
+            if truncated:
+                texts[field] = _spool(call_id, field, text)
+            _buffers[f"{field}_truncated"][slot] = truncated
+
+        for field, value in zip(
+            _TEXT_FIELDS,
+            (timestamp, caller, texts["prompt"], texts["response"], parsed_result, error),
+        ):
+            _log_columns[field].append(value)
+        for field, value in zip(
+            _INT_FIELDS, (layer, input_tokens, output_tokens, cache_read_tokens, latency_ms)
+        ):
+            _buffers[field][slot] = _MISSING if value is None else value
+
+        if model is None:
+            model_code = _MISSING
+        else:
+            model_code = _model_index.get(model)
+            if model_code is None:
+                model_code = _model_index[model] = len(_model_names)
+                _model_names.append(model)
+                _model_costs.append(_cost_entry(model))
+        _buffers["model"][slot] = model_code
+        _buffers["cached"][slot] = cached
+
+        # Untracked values are kept as None in the log (the debug page
+        # shows them as unknown) but count as 0 in the totals
+        _add_to_totals(
+            layer=layer,
+            model=model,
+            cost_entry=None if model is None else _model_costs[model_code],
+            inp=input_tokens or 0,
+            out=output_tokens or 0,
+            latency=latency_ms or 0,
+            cached=cached,
+            timed=not cached and latency_ms is not None,
+            errored=bool(error),
+        )
+
+
+def _spool_path(call_id: int, field: str) -> Path | None:
+    """Spool file of a call's prompt or response text."""
+    return None if _spool_dir is None else _spool_dir / f"{call_id}.{field}.txt"
+
+
+def _spool(call_id: int, field: str, text: str) -> str:
+    """Write a long text to its spool file and return the in-memory preview."""
+    global _spool_dir
+
+    if _spool_dir is None:
+        _spool_dir = Path(tempfile.mkdtemp(prefix="bita_llm_logs_"))
+    _spool_path(call_id, field).write_text(text, encoding="utf-8")
+    return f"{text[:_PREVIEW_CHARS]}\n…\n{text[-_PREVIEW_CHARS:]}"
+
+
+def _drop_spooled(slot: int) -> None:
+    """Delete the spool files of the call being evicted from a buffer slot."""
+    call_id = int(_buffers["call_id"][slot])
+    for field in _SPOOLED_FIELDS:
+        if _buffers[f"{field}_truncated"][slot]:
+            _spool_path(call_id, field).unlink(missing_ok=True)
+
+
+def _remove_spool_dir() -> None:
+    """Delete all spool files."""
+    global _spool_dir
+
+    if _spool_dir is not None:
+        shutil.rmtree(_spool_dir, ignore_errors=True)
+        _spool_dir = None
+
+
+atexit.register(_remove_spool_dir)
+
+
+def get_full_text(call_id: int, field: str) -> str | None:
+    """Full prompt or response of a logged call whose entry is truncated.
+
+    Args:
+        call_id: "call_id" of a get_llm_logs entry
+        field: "prompt" or "response"
+
+    Returns:
+        The complete text, or None if it was not spooled (the entry already
+        holds all of it) or the call has since been evicted or cleared
+    """
+    with _lock:
+        path = _spool_path(call_id, field)
+    try:
+        return path.read_text(encoding="utf-8") if path is not None else None
+    except FileNotFoundError:
+        return None
+
+
+def _add_to_totals(
+    *,
+    layer: int | None,
+    model: str | None,
+    cost_entry: dict[str, float] | None,
+    inp: int,
+    out: int,
+    latency: int,
+    cached: bool,
+    timed: bool,
+    errored: bool,
+) -> None:
+    """Fold one logged call into the running aggregates (caller holds _lock).
+
+    Args:
+        timed: Non-cached call that reported a latency; only these count
+            toward the average latency
+    """
+    _totals["calls"] += 1
+    _totals["input_tokens"] += inp
+    _totals["output_tokens"] += out
+    _totals["latency_ms"] += latency
+    if cached:
+        _totals["cached_calls"] += 1
+    if timed:
+        _totals["timed_calls"] += 1
+        _totals["timed_latency_ms"] += latency
+
+    if cost_entry:
+        _totals["estimated_cost"] += (
+            inp / 1000.0 * cost_entry["input"] + out / 1000.0 * cost_entry["output"]
+        )
+
+    if layer is not None:
+        layer_stats = _per_layer.get(layer)
+        if layer_stats is None:
+            layer_stats = _per_layer[layer] = {
+                "calls": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "latency_ms": 0,
+                "errors": 0,
+            }
+        layer_stats["calls"] += 1
+        layer_stats["input_tokens"] += inp
+        layer_stats["output_tokens"] += out
+        layer_stats["latency_ms"] += latency
+        if errored:
+            layer_stats["errors"] += 1
+
+    if model is not None:
+        model_stats = _per_model.get(model)
+        if model_stats is None:
+            model_stats = _per_model[model] = {
+                "calls": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+            }
+        model_stats["calls"] += 1
+        model_stats["input_tokens"] += inp
+        model_stats["output_tokens"] += out
+
+
+@lru_cache(maxsize=256)
+def _cost_entry(model: str) -> dict[str, float] | None:
+    """Cost table entry for a model, matched by longest name prefix."""
+    match = _COST_KEY_RE.match(model)
+    return _MODEL_COST_PER_1K[match.group()] if match else None
+
+
+def get_llm_logs(limit: int | None = None, offset: int = 0) -> list[dict[str, Any]]:
+    """Return recorded LLM calls, newest first.
+
+    Args:
+        limit: Return at most this many calls (all by default)
+        offset: Skip this many of the newest calls first
+
+    Returns:
+        Log entries; only the requested window is materialized
+
+    Raises:
+        ValueError: If offset or limit is negative
+    """
+    if offset < 0:
+        raise ValueError(f"offset must be >= 0, got {offset}")
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must be >= 0 or None, got {limit}")
+    with _lock:
+        # Retained-row positions of the window, newest first, and their
+        # buffer slots
+        first = _size - 1 - offset
+        stop = -1 if limit is None else max(first - limit, -1)
+        positions = np.arange(first, stop, -1)
+        slots = (_start + positions) % len(_buffers["cached"])
+        count = len(positions)
+
+        columns = {
+            field: list(islice(reversed(_log_columns[field]), offset, offset + count))
+            for field in _TEXT_FIELDS
         }
-    )
+        for field in _INT_FIELDS:
+            columns[field] = [
+                None if value == _MISSING else value for value in _buffers[field][slots].tolist()
+            ]
+        columns["model"] = [
+            None if code == _MISSING else _model_names[code]
+            for code in _buffers["model"][slots].tolist()
+        ]
+        for field in ("cached", "call_id", "prompt_truncated", "response_truncated"):
+            columns[field] = _buffers[field][slots].tolist()
+
+        rows = zip(*(columns[field] for field in _LOG_FIELDS))
+        return [dict(zip(_LOG_FIELDS, row)) for row in rows]
 
 
-def get_llm_logs() -> list[dict[str, Any]]:
-    """Return all recorded LLM calls (newest first)."""
-    return list(reversed(_llm_logs))
+def llm_log_count() -> int:
+    """Number of calls get_llm_logs can currently return.
+
+    Cheap alternative to len(get_llm_logs()) for counts and paging.
+    """
+    return _size
 
 
 def get_llm_stats() -> dict[str, Any]:
     """Aggregate statistics across all logged LLM calls.
 
+    Covers every call since the last clear, including older calls that
+    get_llm_logs no longer returns.
+
     Returns:
         Dictionary with:
         - total_calls: Total number of LLM calls
@@ -90,85 +441,22 @@ def get_llm_stats() -> dict[str, Any]:
         - per_layer: Dict keyed by layer number with per-layer breakdowns
         - per_model: Dict keyed by model name with per-model breakdowns
     """
-    total_calls = len(_llm_logs)
-    cached_calls = sum(1 for log in _llm_logs if log.get("cached"))
-    total_input = sum(log.get("input_tokens") or 0 for log in _llm_logs)
-    total_output = sum(log.get("output_tokens") or 0 for log in _llm_logs)
-    total_latency = sum(log.get("latency_ms") or 0 for log in _llm_logs)
-
-    non_cached_with_latency = [
-        log for log in _llm_logs
-        if not log.get("cached") and log.get("latency_ms") is not None
-    ]
-    non_cached_latency_sum = sum(
-        log.get("latency_ms") or 0 for log in non_cached_with_latency
-    )
-    avg_latency = (
-        non_cached_latency_sum / len(non_cached_with_latency)
-        if non_cached_with_latency
-        else 0.0
-    )
+    with _lock:
+        totals = dict(_totals)
+        per_layer = {layer: dict(stats) for layer, stats in _per_layer.items()}
+        per_model = {model: dict(stats) for model, stats in _per_model.items()}
 
-    # Estimate cost
-    estimated_cost = 0.0
-    for log in _llm_logs:
-        model = log.get("model") or ""
-        # Match model to cost table (prefix match)
-        cost_entry = None
-        for model_key in _MODEL_COST_PER_1K:
-            if model.startswith(model_key):
-                cost_entry = _MODEL_COST_PER_1K[model_key]
-                break
-        if cost_entry:
-            inp = (log.get("input_tokens") or 0) / 1000.0
-            out = (log.get("output_tokens") or 0) / 1000.0
-            estimated_cost += inp * cost_entry["input"] + out * cost_entry["output"]
-
-    # Per-layer breakdown
-    per_layer: dict[int, dict[str, Any]] = {}
-    for log in _llm_logs:
-        layer = log.get("layer")
-        if layer is None:
-            continue
-        if layer not in per_layer:
-            per_layer[layer] = {
-                "calls": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "latency_ms": 0,
-                "errors": 0,
-            }
-        per_layer[layer]["calls"] += 1
-        per_layer[layer]["input_tokens"] += log.get("input_tokens") or 0
-        per_layer[layer]["output_tokens"] += log.get("output_tokens") or 0
-        per_layer[layer]["latency_ms"] += log.get("latency_ms") or 0
-        if log.get("error"):
-            per_layer[layer]["errors"] += 1
-
-    # Per-model breakdown
-    per_model: dict[str, dict[str, Any]] = {}
-    for log in _llm_logs:
-        model = log.get("model")
-        if model is None:
-            continue
-        if model not in per_model:
-            per_model[model] = {
-                "calls": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-            }
-        per_model[model]["calls"] += 1
-        per_model[model]["input_tokens"] += log.get("input_tokens") or 0
-        per_model[model]["output_tokens"] += log.get("output_tokens") or 0
+    timed_calls = totals["timed_calls"]
+    avg_latency = totals["timed_latency_ms"] / timed_calls if timed_calls else 0.0
 
     return {
-        "total_calls": total_calls,
-        "cached_calls": cached_calls,
-        "total_input_tokens": total_input,
-        "total_output_tokens": total_output,
-        "total_tokens": total_input + total_output,
-        "estimated_cost_usd": round(estimated_cost, 6),
-        "total_latency_ms": total_latency,
+        "total_calls": totals["calls"],
+        "cached_calls": totals["cached_calls"],
+        "total_input_tokens": totals["input_tokens"],
+        "total_output_tokens": totals["output_tokens"],
+        "total_tokens": totals["input_tokens"] + totals["output_tokens"],
+        "estimated_cost_usd": round(totals["estimated_cost"], 6),
+        "total_latency_ms": totals["latency_ms"],
         "avg_latency_ms": round(avg_latency, 1),
         "per_layer": per_layer,
         "per_model": per_model,
@@ -177,4 +465,16 @@ def get_llm_stats() -> dict[str, Any]:
 
 def clear_llm_logs() -> None:
     """Clear all recorded LLM calls."""
-    _llm_logs.clear()
+    global _start, _size, _next_call_id
+
+    with _lock:
+        for column in _log_columns.values():
+            column.clear()
+        _model_names.clear()
+        _model_index.clear()
+        _model_costs.clear()
+        _start = 0
+        _size = 0
+        _next_call_id = 0
+        _remove_spool_dir()
+        _reset_totals()
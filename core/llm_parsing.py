@@ -0,0 +1,113 @@
+"""LLM Parsing — Tolerant JSON handling for model responses.
+
+Salvages truncated or slightly malformed JSON instead of discarding the call.
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+# Opening fence (optional language tag), body, optional closing fence
+_FENCE_RE = re.compile(r"^```[\w-]*[ \t]*\n?(.*?)(?:\n?```\s*)?$", re.DOTALL)
+
+
+def strip_code_fences(content: str) -> str:
+    """Return the body of a markdown-fenced response, or the text unchanged.
+
+    Single regex scan; tolerates a missing closing fence on truncated output.
+
+    Args:
+        content: Stripped model output
+    """
+    if not content.startswith("```"):
+        return content
+    match = _FENCE_RE.match(content)
+    return match.group(1) if match else content
+
+
+def repair_json(text: str) -> str:
+    """Best-effort repair of a JSON document emitted by an LLM.
+
+    Single pass over the text: drops any prose before the first bracket and
+    after the first complete top-level value (or a code fence), closes an
+    unterminated string, fills a dangling ``"key":`` with null, and closes
+    any open brackets.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Repaired JSON text (not guaranteed to parse if badly damaged)
+    """
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        return text.strip()
+    text = text[min(starts):]
+
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == "`":
+            # Closing markdown fence on a truncated value
+            text = text[:i]
+            break
+        elif ch in "{[":
+            closers.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if closers and closers[-1] == ch:
+                closers.pop()
+            if not closers:
+                return _TRAILING_COMMA.sub(r"\1", text[: i + 1])
+
+    # Truncated: close whatever is still open
+    if escaped:
+        text = text[:-1]
+    if in_string:
+        text += '"'
+    text = text.rstrip()
+    while text.endswith(","):
+        text = text[:-1].rstrip()
+    if text.endswith(":"):
+        text += " null"
+    return _TRAILING_COMMA.sub(r"\1", text + "".join(reversed(closers)))
+
+
+def loads(text: str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib parser.
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def loads_lenient(text: str) -> Any:
+    """Parse JSON, falling back to repair_json when strict parsing fails.
+
+    Raises:
+        json.JSONDecodeError: If the text cannot be parsed even after repair
+    """
+    try:
+        return loads(text)
+    except json.JSONDecodeError:
+        return loads(repair_json(text))
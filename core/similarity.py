@@ -0,0 +1,78 @@
+"""Lexical similarity helpers.
+
+Cheap TF-IDF cosine similarity used to screen out clearly unrelated
+objective / task group pairs before they reach the LLM judge.
+"""
+
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or our the to with "
+    "we will this that these those all across per via".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with stopwords and single characters removed."""
+    return [
+        tok
+        for tok in _TOKEN_PATTERN.findall(text.lower())
+        if len(tok) > 1 and tok not in _STOPWORDS
+    ]
+
+
+def tfidf_vectors(texts: list[str]) -> list[dict[str, float]]:
+    """Build L2-normalized sparse TF-IDF vectors for a small corpus.
+
+    Args:
+        texts: Documents to vectorize (IDF is computed over this list)
+
+    Returns:
+        One {term: weight} dict per document
+    """
+    token_lists = [tokenize(text) for text in texts]
+    doc_freq = Counter(term for tokens in token_lists for term in set(tokens))
+    n_docs = len(texts)
+
+    vectors = []
+    for tokens in token_lists:
+        counts = Counter(tokens)
+        vec = {
+            term: count * (math.log((1 + n_docs) / (1 + doc_freq[term])) + 1)
+            for term, count in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vec.values()))
+        vectors.append({term: w / norm for term, w in vec.items()} if norm else {})
+    return vectors
+
+
+def cosine_matrix(row_texts: list[str], col_texts: list[str]) -> np.ndarray:
+    """Cosine similarity between every row text and every column text.
+
+    Both lists share one IDF vocabulary so scores are comparable. Vectors
+    are L2-normalized, so the whole matrix is a single dense matmul.
+
+    Args:
+        row_texts: First set of documents (e.g. objectives)
+        col_texts: Second set of documents (e.g. task groups)
+
+    Returns:
+        Array of shape (len(row_texts), len(col_texts))
+    """
+    vectors = tfidf_vectors(row_texts + col_texts)
+    # Sorted so column order (and float summation order) is stable across runs
+    vocab = {term: i for i, term in enumerate(sorted({t for vec in vectors for t in vec}))}
+
+    dense = np.zeros((len(vectors), len(vocab)), dtype=np.float32)
+    for row, vec in enumerate(vectors):
+        for term, weight in vec.items():
+            dense[row, vocab[term]] = weight
+
+    n_rows = len(row_texts)
+    return dense[:n_rows] @ dense[n_rows:].T
@@ -7,25 +7,34 @@ import json
 
 import streamlit as st
 
-from core.llm_logger import clear_llm_logs, get_llm_logs, get_llm_stats
+from core.llm_logger import (
+    clear_llm_logs,
+    get_full_text,
+    get_llm_logs,
+    get_llm_stats,
+    llm_log_count,
+)
+
+# Calls shown per page of the call log; only that page is fetched per rerun
+PAGE_SIZE = 50
 
 
 def render():
     """Render the LLM debug page."""
     st.header("LLM Debug View")
 
-    logs = get_llm_logs()
+    log_count = llm_log_count()
     stats = get_llm_stats()
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.markdown(f"**{len(logs)}** LLM call(s) recorded this session")
+        st.markdown(f"**{log_count}** LLM call(s) recorded this session")
     with col2:
         if st.button("Clear logs"):
             clear_llm_logs()
             st.rerun()
 
-    if not logs:
+    if not log_count:
         st.info("No LLM calls recorded yet. Upload plans and run extraction to see calls here.")
         return
 
@@ -107,29 +116,39 @@ def render():
     st.markdown("---")
     st.markdown("### Call Log")
 
-    # Filter options
-    filter_col1, filter_col2 = st.columns(2)
+    # Filter and paging options
+    page_count = (log_count + PAGE_SIZE - 1) // PAGE_SIZE
+    filter_col1, filter_col2, filter_col3 = st.columns(3)
     with filter_col1:
         layer_filter = st.selectbox(
             "Filter by Layer",
-            options=["All"] + sorted(set(
-                str(log.get("layer", "N/A")) for log in logs if log.get("layer") is not None
-            )),
+            options=["All"] + [str(layer) for layer in sorted(stats.get("per_layer", {}))],
         )
     with filter_col2:
         show_cached = st.checkbox("Show cached calls", value=True)
-
-    filtered_logs = logs
+    with filter_col3:
+        page = st.number_input(
+            f"Page (of {page_count}, newest first)",
+            min_value=1, max_value=page_count, value=1, step=1,
+        ) - 1
+
+    offset = page * PAGE_SIZE
+    logs = get_llm_logs(limit=PAGE_SIZE, offset=offset)
+    # (position among all retained calls, entry), numbered before filtering
+    filtered_logs = list(enumerate(logs, start=offset + 1))
     if layer_filter != "All":
-        filtered_logs = [log for log in filtered_logs if str(log.get("layer")) == layer_filter]
+        filtered_logs = [(n, log) for n, log in filtered_logs if str(log.get("layer")) == layer_filter]
     if not show_cached:
-        filtered_logs = [log for log in filtered_logs if not log.get("cached")]
+        filtered_logs = [(n, log) for n, log in filtered_logs if not log.get("cached")]
 
-    st.markdown(f"Showing **{len(filtered_logs)}** of {len(logs)} calls")
+    st.markdown(
+        f"Showing **{len(filtered_logs)}** of {len(logs)} calls on this page "
+        f"(calls {offset + 1}-{offset + len(logs)} of {log_count})"
+    )
 
-    for i, entry in enumerate(filtered_logs):
+    for position, entry in filtered_logs:
         # Build label with metadata
-        parts = [f"#{i+1}", entry['caller']]
+        parts = [f"#{position}", entry['caller']]
 
         if entry.get("layer") is not None:
             parts.append(f"L{entry['layer']}")
@@ -167,11 +186,11 @@ def render():
                 st.markdown(f"**Cached:** {'Yes' if entry.get('cached') else 'No'}")
 
             st.markdown("**Prompt:**")
-            st.code(entry["prompt"], language="text")
+            _render_text(entry, "prompt", "text")
 
             if entry.get("response") is not None:
                 st.markdown("**Response:**")
-                st.code(entry["response"], language="json")
+                _render_text(entry, "response", "json")
 
             if entry.get("parsed_result") is not None:
                 st.markdown("**Parsed Result:**")
@@ -182,3 +201,18 @@ def render():
 
             if entry.get("error"):
                 st.error(f"**Parse Error:** {entry['error']}")
+
+
+def _render_text(entry: dict, field: str, language: str):
+    """Show a logged prompt/response, loading long texts only on request."""
+    if not entry.get(f"{field}_truncated"):
+        st.code(entry[field], language=language)
+        return
+
+    show_full = st.checkbox(
+        f"Show full {field}", key=f"llm_full_{field}_{entry['call_id']}"
+    )
+    full_text = get_full_text(entry["call_id"], field) if show_full else None
+    if full_text is None:
+        st.caption(f"Long {field}: showing start and end only")
+    st.code(full_text or entry[field], language=language)
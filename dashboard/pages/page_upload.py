@@ -157,16 +157,11 @@ def run_layer1_extraction(strategic_file, action_files, api_key):
         llm_provider = st.session_state.get("uploaded_llm_provider", "Anthropic")
         llm_model = st.session_state.get("uploaded_llm_model")
 
-        with st.spinner(f"Extracting strategic goals with {llm_model}..."):
+        with st.spinner(f"Extracting strategic goals and action plan task groups with {llm_model}..."):
             extractor = StructuredExtractor(api_key=api_key, model=llm_model, provider=llm_provider)
-            strategic_goals = extractor.extract_strategic_plan(strategic_text)
+            strategic_goals, task_groups = extractor.extract_plans(strategic_text, action_text)
 
         st.success(f"✓ Extracted {len(strategic_goals)} strategic goals")
-        progress_bar.progress(35)
-
-        with st.spinner(f"Extracting action plan task groups with {llm_model}..."):
-            task_groups = extractor.extract_action_plan(action_text)
-
         st.success(f"✓ Extracted {len(task_groups)} task groups")
         progress_bar.progress(50)
 